@@ -3,45 +3,66 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.table import Table
 
 from claude_env_sync import __version__
-from claude_env_sync.core.git_ops import GitOps
-from claude_env_sync.core.sync_engine import SyncEngine
+from claude_env_sync.core.path_resolver import home_dir
 from claude_env_sync.hooks.install import (
     install_shell_hook,
-    is_hook_installed,
     uninstall_shell_hook,
 )
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
 
-_DEFAULT_CLAUDE_DIR = str(Path.home() / ".claude")
-_DEFAULT_SYNC_REPO = str(Path.home() / ".claude-sync-repo")
-_DEFAULT_BACKUP_DIR = str(Path.home() / ".claude-sync-backup")
+    from claude_env_sync.core.sync_engine import SyncEngine
+
+# rich, GitPython은 import 비용이 커서 shell hook이 매번 호출하는
+# CLI 시작 시간을 좌우한다. 실제로 필요한 명령에서만 불러온다.
+_console: Console | None = None
+
+
+def _home_default(name: str):
+    """홈 디렉토리 아래 경로를 기본값으로 쓰는 click 옵션용 callable을 만든다.
+
+    홈 디렉토리는 import 시점이 아니라 옵션을 해석할 때 조회한다.
+    """
+    return lambda: str(home_dir() / name)
+
+
+_CLAUDE_DIR_OPTION = click.option(
+    "--claude-dir", default=_home_default(".claude"), type=click.Path(),
+    help="Claude 설정 디렉토리 경로",
+)
+_SYNC_REPO_OPTION = click.option(
+    "--sync-repo", default=_home_default(".claude-sync-repo"), type=click.Path(),
+    help="동기화 Git 저장소 경로",
+)
+_BACKUP_DIR_OPTION = click.option(
+    "--backup-dir", default=_home_default(".claude-sync-backup"), type=click.Path(),
+    help="백업 디렉토리 경로",
+)
 
 
 def _common_options(f):
     """공통 옵션 데코레이터."""
-    f = click.option(
-        "--claude-dir", default=_DEFAULT_CLAUDE_DIR, type=click.Path(),
-        help="Claude 설정 디렉토리 경로",
-    )(f)
-    f = click.option(
-        "--sync-repo", default=_DEFAULT_SYNC_REPO, type=click.Path(),
-        help="동기화 Git 저장소 경로",
-    )(f)
-    f = click.option(
-        "--backup-dir", default=_DEFAULT_BACKUP_DIR, type=click.Path(),
-        help="백업 디렉토리 경로",
-    )(f)
-    return f
+    return _BACKUP_DIR_OPTION(_SYNC_REPO_OPTION(_CLAUDE_DIR_OPTION(f)))
+
+
+def _get_console() -> Console:
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def _make_engine(claude_dir: str, sync_repo: str, backup_dir: str) -> SyncEngine:
+    from claude_env_sync.core.sync_engine import SyncEngine
+
     return SyncEngine(
         claude_dir=Path(claude_dir),
         sync_repo_dir=Path(sync_repo),
@@ -63,6 +84,7 @@ def init(claude_dir: str, sync_repo: str, backup_dir: str, remote: str | None):
     engine = _make_engine(claude_dir, sync_repo, backup_dir)
     engine.initialize(remote_url=remote)
 
+    console = _get_console()
     console.print("[green]초기화 완료![/green]")
     console.print(f"  동기화 저장소: {sync_repo}")
     if remote:
@@ -72,16 +94,29 @@ def init(claude_dir: str, sync_repo: str, backup_dir: str, remote: str | None):
 @main.command()
 @_common_options
 @click.option("--message", "-m", default=None, help="커밋 메시지")
-def push(claude_dir: str, sync_repo: str, backup_dir: str, message: str | None):
+@click.option(
+    "--verbose", "-v", is_flag=True, default=False,
+    help="시크릿 감지 시 전체 목록 표시",
+)
+def push(
+    claude_dir: str,
+    sync_repo: str,
+    backup_dir: str,
+    message: str | None,
+    verbose: bool,
+):
     """현재 Claude 설정을 동기화 저장소로 push합니다."""
     engine = _make_engine(claude_dir, sync_repo, backup_dir)
     engine.initialize()
-    result = engine.push(message=message)
+    result = engine.push(message=message, report_all_secrets=verbose)
 
+    console = _get_console()
     if result.secrets_found:
         console.print("[red]시크릿 감지! Push가 중단되었습니다.[/red]")
         for detail in result.secret_details:
             console.print(f"  [yellow]{detail}[/yellow]")
+        if not verbose:
+            console.print("[dim]전체 목록은 --verbose로 확인하세요.[/dim]")
         return
 
     if result.committed:
@@ -97,6 +132,7 @@ def pull(claude_dir: str, sync_repo: str, backup_dir: str):
     engine = _make_engine(claude_dir, sync_repo, backup_dir)
     engine.initialize()
     result = engine.pull()
+    console = _get_console()
     console.print(f"[green]복원 완료![/green] {result.files_synced}개 파일")
     console.print(f"  백업 위치: {backup_dir}")
 
@@ -109,6 +145,7 @@ def status(claude_dir: str, sync_repo: str, backup_dir: str):
     engine.initialize()
     sync_status = engine.status()
 
+    console = _get_console()
     if sync_status.in_sync:
         console.print("[green]동기화 상태: 최신[/green]")
     else:
@@ -126,10 +163,15 @@ def status(claude_dir: str, sync_repo: str, backup_dir: str):
 @click.option("--limit", "-n", default=10, help="표시할 커밋 수")
 def history(claude_dir: str, sync_repo: str, backup_dir: str, limit: int):
     """동기화 변경 이력을 조회합니다."""
-    git_ops = GitOps(Path(sync_repo))
-    git_ops.init_repo()
-    log = git_ops.get_log(limit=limit)
+    from rich.table import Table
+
+    from claude_env_sync.core.git_ops import GitOps
+
+    with GitOps(Path(sync_repo)) as git_ops:
+        git_ops.init_repo()
+        log = git_ops.get_log(limit=limit)
 
+    console = _get_console()
     if not log:
         console.print("[dim]아직 동기화 이력이 없습니다.[/dim]")
         return
@@ -140,13 +182,14 @@ def history(claude_dir: str, sync_repo: str, backup_dir: str, limit: int):
     table.add_column("날짜", style="green")
     table.add_column("파일", style="yellow")
 
+    add_row = table.add_row
     for entry in log:
-        table.add_row(
+        files = entry.files_changed
+        add_row(
             entry.sha[:8],
             entry.message,
             entry.date.strftime("%Y-%m-%d %H:%M"),
-            ", ".join(entry.files_changed[:3])
-            + ("..." if len(entry.files_changed) > 3 else ""),
+            ", ".join(files[:3]) + ("..." if len(files) > 3 else ""),
         )
 
     console.print(table)
@@ -157,14 +200,12 @@ def history(claude_dir: str, sync_repo: str, backup_dir: str, limit: int):
 @click.argument("ref")
 def restore(claude_dir: str, sync_repo: str, backup_dir: str, ref: str):
     """특정 시점으로 설정을 복원합니다."""
-    git_ops = GitOps(Path(sync_repo))
-    git_ops.init_repo()
-    git_ops.restore_to(ref)
-
     engine = _make_engine(claude_dir, sync_repo, backup_dir)
     engine.initialize()
+    engine.git_ops.restore_to(ref)
     engine.pull()
 
+    console = _get_console()
     console.print(f"[green]복원 완료![/green] {ref[:8]} 시점으로 되돌렸습니다.")
 
 
@@ -180,13 +221,13 @@ def hook():
 )
 def hook_install(shell: str):
     """Shell RC 파일에 자동 동기화 hook을 설치합니다."""
+    console = _get_console()
     rc_files = _resolve_rc_files(shell)
     for rc_file in rc_files:
-        if is_hook_installed(rc_file):
-            console.print(f"[dim]이미 설치됨: {rc_file}[/dim]")
-        else:
-            install_shell_hook(rc_file)
+        if install_shell_hook(rc_file):
             console.print(f"[green]Hook 설치 완료: {rc_file}[/green]")
+        else:
+            console.print(f"[dim]이미 설치됨: {rc_file}[/dim]")
 
 
 @hook.command("uninstall")
@@ -196,10 +237,10 @@ def hook_install(shell: str):
 )
 def hook_uninstall(shell: str):
     """Shell RC 파일에서 자동 동기화 hook을 제거합니다."""
+    console = _get_console()
     rc_files = _resolve_rc_files(shell)
     for rc_file in rc_files:
-        if is_hook_installed(rc_file):
-            uninstall_shell_hook(rc_file)
+        if uninstall_shell_hook(rc_file):
             console.print(f"[green]Hook 제거 완료: {rc_file}[/green]")
         else:
             console.print(f"[dim]설치되지 않음: {rc_file}[/dim]")
@@ -207,17 +248,13 @@ def hook_uninstall(shell: str):
 
 def _resolve_rc_files(shell: str) -> list[Path]:
     """Shell 종류에 따라 RC 파일 경로를 반환한다."""
-    home = Path.home()
+    home = home_dir()
     if shell == "bash":
         return [home / ".bashrc"]
     elif shell == "zsh":
         return [home / ".zshrc"]
     else:
-        candidates = []
-        for name in [".zshrc", ".bashrc"]:
-            rc = home / name
-            if rc.exists():
-                candidates.append(rc)
+        candidates = [rc for rc in (home / ".zshrc", home / ".bashrc") if rc.exists()]
         return candidates if candidates else [home / ".bashrc"]
 
 
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import functools
+import threading
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+from typing import IO, TypeVar
 
-from git import InvalidGitRepositoryError, Repo
+from git import Git, Head, InvalidGitRepositoryError, Repo
 from git.exc import GitCommandError
+from git.objects import Commit
+from git.refs import SymbolicReference
+
+T = TypeVar("T")
+
+# 읽기 전용 명령(status 등)이 index.lock을 잡지 않도록 한다.
+_GIT_ENV = {"GIT_OPTIONAL_LOCKS": "0"}
+
+# `git log` 출력의 커밋 레코드 구분자와 읽기 단위.
+_RECORD_SEP = b"\x1e"
+_LOG_READ_SIZE = 1 << 16
 
 
 class GitOpsError(Exception):
@@ -24,12 +39,45 @@ class LogEntry:
     files_changed: list[str] = field(default_factory=list)
 
 
+def _locked(method: Callable[..., T]) -> Callable[..., T]:
+    """인스턴스의 저장소 락을 잡은 채로 메서드를 실행한다."""
+
+    @functools.wraps(method)
+    def wrapper(self: GitOps, *args, **kwargs) -> T:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class GitOps:
-    """Git 저장소 연산을 관리한다."""
+    """Git 저장소 연산을 관리한다.
+
+    인덱스나 ref를 바꾸는 메서드는 인스턴스별 락으로 직렬화하므로 한
+    인스턴스를 여러 스레드에서 호출해도 `index.lock` 충돌이 나지 않는다.
+    """
 
     def __init__(self, repo_dir: Path) -> None:
         self._repo_dir = repo_dir
         self._repo: Repo | None = None
+        # restore_to → add_and_commit처럼 락을 잡은 메서드끼리 호출하므로 RLock.
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> GitOps:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @_locked
+    def close(self) -> None:
+        """GitPython이 유지하는 `git cat-file` 프로세스를 종료한다.
+
+        닫은 뒤에도 다시 init_repo()를 호출하면 사용할 수 있다.
+        """
+        if self._repo is not None:
+            self._repo.close()
+            self._repo = None
 
     @property
     def repo(self) -> Repo:
@@ -38,75 +86,141 @@ class GitOps:
             raise GitOpsError(msg)
         return self._repo
 
+    @_locked
     def init_repo(self) -> bool:
-        """Git 저장소를 초기화한다. 이미 존재하면 로드한다."""
+        """Git 저장소를 초기화한다. 이미 존재하면 로드한다.
+
+        이미 로드된 저장소가 있으면 다시 열지 않는다.
+        """
+        if self._repo is not None:
+            return True
         try:
             self._repo = Repo(self._repo_dir)
         except (InvalidGitRepositoryError, Exception):
             self._repo = Repo.init(self._repo_dir)
+            # push/pull은 main 브랜치를 쓰므로 새 저장소의 HEAD를 main으로 맞춘다.
+            # `git init -b`(git 2.28+)나 별도 `git symbolic-ref` 호출 대신 직접 쓴다.
+            self._repo.head.set_reference(Head(self._repo, "refs/heads/main"))
+        self._repo.git.update_environment(**_GIT_ENV)
         return True
 
     def is_initialized(self) -> bool:
-        """저장소가 초기화되었는지 확인한다."""
+        """저장소가 초기화되었는지 확인한다.
+
+        `.git`(디렉토리 또는 worktree의 gitfile) 존재 여부로 판단하고,
+        bare 저장소로 보이는 경우에만 Repo를 열어 확인한다.
+        """
+        if (self._repo_dir / ".git").exists():
+            return True
+        if not (self._repo_dir / "HEAD").is_file():
+            return False
         try:
             Repo(self._repo_dir)
             return True
         except (InvalidGitRepositoryError, Exception):
             return False
 
-    def add_and_commit(self, message: str | None = None) -> bool:
-        """모든 변경 사항을 스테이징하고 커밋한다.
+    @_locked
+    def add_and_commit(
+        self, message: str | None = None, paths: list[str] | None = None
+    ) -> bool:
+        """변경 사항을 스테이징하고 커밋한다.
+
+        Args:
+            message: 커밋 메시지. None이면 자동 생성한다.
+            paths: 스테이징할 pathspec 목록 (저장소 기준 상대 경로).
+                   None이면 작업 트리 전체를 스테이징한다.
 
         Returns:
             커밋이 생성되면 True, 변경 사항이 없으면 False.
         """
-        repo = self.repo
-        repo.git.add(A=True)
-
-        if not repo.is_dirty(index=True, working_tree=False, untracked_files=False):
+        if paths is not None and not paths:
             return False
 
+        # 변경 여부는 스테이징 후 인덱스 트리와 HEAD 트리를 비교해 판단하므로
+        # 별도의 `git status` 없이 git 프로세스는 `git add` 한 번만 실행한다.
+        self.stage_paths(paths)
+
         if message is None:
             ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             message = f"claude-sync: auto-sync {ts}"
 
-        repo.index.commit(message)
-        return True
+        return self._commit_index(message)
+
+    @_locked
+    def stage_paths(self, paths: list[str] | None = None) -> None:
+        """지정한 pathspec만 스테이징한다 (추가/수정/삭제 모두).
+
+        git이 .gitignore 규칙과 인덱스 stat 캐시를 그대로 적용하면서도
+        탐색 범위는 주어진 경로로 한정된다. None이면 작업 트리 전체.
+        """
+        if paths is None:
+            self.repo.git.add(A=True)
+        elif paths:
+            self.repo.git.add("-A", "--", *paths)
+
+    def list_tracked_files(self) -> list[str]:
+        """인덱스가 추적 중인 파일의 저장소 기준 상대 경로 목록을 반환한다.
+
+        `git ls-files` 대신 GitPython이 읽은 인덱스를 그대로 사용한다.
+        """
+        return [path for path, _stage in self.repo.index.entries]
 
     def get_log(self, limit: int = 20) -> list[LogEntry]:
         """커밋 로그를 반환한다. 최신 순."""
+        return list(self.iter_log(limit=limit))
+
+    def iter_log(self, limit: int = 20) -> Iterator[LogEntry]:
+        """커밋 로그를 최신 순으로 하나씩 생성한다."""
         repo = self.repo
         try:
             repo.head.commit
         except ValueError:
-            return []
-
-        entries: list[LogEntry] = []
-        for commit in repo.iter_commits(max_count=limit):
-            files_changed: list[str] = []
-            if commit.parents:
-                diff = commit.parents[0].diff(commit)
-                files_changed = [d.a_path or d.b_path for d in diff]
-            else:
-                files_changed = list(commit.stats.files.keys())
-
-            entries.append(
-                LogEntry(
-                    sha=commit.hexsha,
-                    message=commit.message.strip(),
-                    date=commit.committed_datetime,
-                    files_changed=files_changed,
-                )
-            )
-
-        return entries
-
+            return
+
+        # 커밋 메타데이터와 변경 파일 목록을 `git log` 한 번으로 받아 스트리밍으로
+        # 파싱한다. 각 커밋은 \x1e로 시작하고 필드는 \x1f로 구분되며, 파일 목록은
+        # -z에 따라 NUL로 끝난다. --name-only만으로는 머지 커밋의 파일 목록이
+        # 비므로, 이전과 같이 첫 번째 부모 기준으로 비교한다.
+        process = repo.git.log(
+            f"--max-count={limit}",
+            "-z",
+            "--name-only",
+            "--no-renames",
+            *_first_parent_diff_args(),
+            "--format=%x1e%H%x1f%cI%x1f%B%x1f",
+            as_process=True,
+        )
+        try:
+            for record in _iter_records(process.stdout):
+                yield _parse_log_record(record)
+            process.wait()
+        finally:
+            if process.poll() is None:
+                process.kill()
+                process.communicate()
+
+    @_locked
     def add_remote(self, url: str, name: str = "origin") -> None:
-        """원격 저장소를 추가한다."""
+        """원격 저장소를 추가한다. 같은 이름이 있으면 교체한다.
+
+        `git remote add/rm` 대신 설정 파일과 ref를 프로세스 내부에서 직접
+        갱신한다. 기존 원격을 교체할 때는 `git remote rm`과 같이 이전
+        원격의 추적 브랜치(refs/remotes/<name>/*)도 지운다.
+        """
         repo = self.repo
-        if name in [r.name for r in repo.remotes]:
-            repo.delete_remote(name)
-        repo.create_remote(name, url)
+        section = f'remote "{name}"'
+        tracking_prefix = f"refs/remotes/{name}/"
+        for ref in repo.refs:
+            if ref.path.startswith(tracking_prefix):
+                # RemoteReference.delete는 `git branch -d -r`를 실행한다.
+                SymbolicReference.delete(repo, ref.path)
+
+        with repo.config_writer() as config:
+            if config.has_section(section):
+                config.remove_section(section)
+            config.set_value(section, "url", url)
+            config.set_value(section, "fetch", f"+refs/heads/*:{tracking_prefix}*")
 
     def has_remote(self, name: str = "origin") -> bool:
         """원격 저장소가 설정되어 있는지 확인한다."""
@@ -119,6 +233,7 @@ class GitOps:
                 return remote.url
         return None
 
+    @_locked
     def push(self, remote: str = "origin", branch: str = "main") -> bool:
         """원격 저장소로 push한다.
 
@@ -131,6 +246,7 @@ class GitOps:
         except (GitCommandError, IndexError) as e:
             raise GitOpsError(f"Push 실패: {e}") from e
 
+    @_locked
     def pull(self, remote: str = "origin", branch: str = "main") -> bool:
         """원격 저장소에서 pull한다. fast-forward only.
 
@@ -143,23 +259,105 @@ class GitOps:
         except (GitCommandError, IndexError) as e:
             raise GitOpsError(f"Pull 실패 (충돌 가능성): {e}") from e
 
+    @_locked
     def restore_to(self, sha: str) -> None:
         """특정 커밋 시점으로 작업 트리를 복원한다.
 
-        복원 전 현재 상태를 백업 커밋으로 저장한다.
+        복원 전 현재 상태에 변경 사항이 있으면 백업 커밋으로 저장한다.
         """
         repo = self.repo
 
-        if self.has_changes():
-            self.add_and_commit(f"backup before restore to {sha[:8]}")
+        self.add_and_commit(f"backup before restore to {sha[:8]}")
 
+        # `checkout <sha> -- .`는 작업 트리와 인덱스를 함께 갱신하므로
+        # 별도의 `git add -A`(작업 트리 전체 재해시) 없이 바로 커밋한다.
         repo.git.checkout(sha, "--", ".")
-        repo.git.add(A=True)
+        self._commit_index(f"restore to {sha[:8]}")
+
+    def _commit_index(self, message: str) -> bool:
+        """스테이징된 인덱스가 HEAD와 다를 때만 커밋한다.
 
-        if repo.is_dirty(index=True, working_tree=False, untracked_files=False):
-            repo.index.commit(f"restore to {sha[:8]}")
+        `git diff --cached` 서브프로세스 대신 인덱스 트리와 HEAD 트리의
+        SHA를 프로세스 내부에서 비교한다.
 
-    def has_changes(self) -> bool:
-        """작업 트리에 변경 사항이 있는지 확인한다."""
+        Returns:
+            커밋이 생성되면 True, 인덱스가 HEAD와 같으면 False.
+        """
         repo = self.repo
-        return repo.is_dirty(working_tree=True, untracked_files=True)
+        index = repo.index
+        tree = index.write_tree()
+
+        try:
+            head_tree = repo.head.commit.tree
+        except ValueError:
+            if not index.entries:
+                return False
+        else:
+            if head_tree.binsha == tree.binsha:
+                return False
+
+        Commit.create_from_tree(repo, tree, message, head=True)
+        return True
+
+    def has_changes(self, paths: list[str] | None = None) -> bool:
+        """작업 트리에 변경 사항이 있는지 확인한다.
+
+        `is_dirty`는 index/작업 트리/untracked를 각각 별도 명령으로 조회하므로
+        `git status --porcelain` 한 번으로 대신한다.
+
+        Args:
+            paths: 확인할 pathspec 목록. None이면 작업 트리 전체.
+        """
+        args = ["--porcelain", "--no-ahead-behind", "--untracked-files=normal"]
+        if paths is not None:
+            if not paths:
+                return False
+            args += ["--", *paths]
+        return bool(self.repo.git.status(*args))
+
+
+@functools.cache
+def _first_parent_diff_args() -> tuple[str, ...]:
+    """머지 커밋을 첫 번째 부모와 비교하도록 하는 `git log` 인자를 반환한다.
+
+    `--diff-merges`는 git 2.31부터 있으므로 git 버전은 프로세스당 한 번만
+    확인한다. 이전 버전에서는 `-m --first-parent`로 대신하며, 이때 로그는
+    첫 번째 부모 이력만 따라간다.
+    """
+    if Git().version_info >= (2, 31):
+        return ("--diff-merges=first-parent",)
+    return ("-m", "--first-parent")
+
+
+def _iter_records(stream: IO[bytes]) -> Iterator[bytes]:
+    """`git log` 출력을 읽으며 \x1e로 시작하는 커밋 레코드를 하나씩 생성한다."""
+    pending: list[bytes] = []
+    while True:
+        chunk = stream.read(_LOG_READ_SIZE)
+        if not chunk:
+            break
+        if _RECORD_SEP not in chunk:
+            pending.append(chunk)
+            continue
+        head, *complete, tail = chunk.split(_RECORD_SEP)
+        pending.append(head)
+        for record in (b"".join(pending), *complete):
+            if record:
+                yield record
+        pending = [tail]
+    record = b"".join(pending)
+    if record:
+        yield record
+
+
+def _parse_log_record(record: bytes) -> LogEntry:
+    """`%H\x1f%cI\x1f%B\x1f` 뒤에 NUL로 끝나는 파일 목록이 붙은 레코드를 파싱한다."""
+    sha, date, rest = record.decode("utf-8", "replace").split("\x1f", 2)
+    message, files = rest.rsplit("\x1f", 1)
+    return LogEntry(
+        sha=sha,
+        message=message.strip(),
+        date=datetime.fromisoformat(date),
+        files_changed=[f for f in files.lstrip("\0\n").split("\0") if f],
+    )
+
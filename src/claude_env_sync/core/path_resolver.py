@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+from claude_env_sync.utils.fs import iter_file_paths
+
+
+def home_dir() -> Path:
+    """홈 디렉토리. 기본 경로가 필요할 때 호출 시점의 HOME으로 조회한다."""
+    return Path.home()
+
 
 class PathResolver:
     """Claude Code 관련 디렉토리 및 파일 경로를 해석한다."""
@@ -15,11 +23,10 @@ class PathResolver:
         config_file: Path | None = None,
         backup_dir: Path | None = None,
     ) -> None:
-        home = Path.home()
-        self._claude_dir = claude_dir or home / ".claude"
-        self._sync_repo_dir = sync_repo_dir or home / ".claude-sync-repo"
-        self._config_file = config_file or home / ".claude-sync.toml"
-        self._backup_dir = backup_dir or home / ".claude-sync-backup"
+        self._claude_dir = claude_dir or home_dir() / ".claude"
+        self._sync_repo_dir = sync_repo_dir or home_dir() / ".claude-sync-repo"
+        self._config_file = config_file or home_dir() / ".claude-sync.toml"
+        self._backup_dir = backup_dir or home_dir() / ".claude-sync-backup"
 
     @property
     def claude_dir(self) -> Path:
@@ -44,25 +51,34 @@ class PathResolver:
         """Claude 디렉토리 기준으로 상대 경로를 절대 경로로 변환한다."""
         return self._claude_dir / relative_path
 
-    def list_syncable_files(self, patterns: list[str]) -> list[Path]:
+    def list_syncable_paths(self, patterns: list[str]) -> list[str]:
         """동기화 대상 패턴에 해당하는 실제 존재하는 파일 목록을 반환한다.
 
+        경로는 문자열로 반환하므로 호출자가 파일마다 Path 객체를 만들지 않는다.
+        다른 디렉토리 패턴 하위에 있는 패턴은 이미 그 탐색에 포함되므로
+        건너뛴다 (같은 하위 트리를 두 번 탐색하거나 같은 파일을 중복으로
+        반환하지 않는다).
+
         Args:
             patterns: 동기화 대상 패턴 목록 (예: ["CLAUDE.md", "agents/"])
                      '/'로 끝나면 디렉토리로 간주하여 재귀 탐색.
 
         Returns:
-            존재하는 파일의 절대 경로 목록.
+            존재하는 파일의 절대 경로 문자열 목록.
         """
-        files: list[Path] = []
-        for pattern in patterns:
-            target = self._claude_dir / pattern
+        root = str(self._claude_dir)
+        unique = list(dict.fromkeys(patterns))
+        dir_prefixes = [p for p in unique if p.endswith("/")]
+        files: list[str] = []
+        for pattern in unique:
+            if any(pattern != d and pattern.startswith(d) for d in dir_prefixes):
+                continue
             if pattern.endswith("/"):
-                dir_path = self._claude_dir / pattern.rstrip("/")
-                if dir_path.is_dir():
-                    files.extend(
-                        f for f in dir_path.rglob("*") if f.is_file()
-                    )
-            elif target.is_file():
-                files.append(target)
+                dir_path = os.path.join(root, pattern.rstrip("/"))
+                if os.path.isdir(dir_path):
+                    files.extend(iter_file_paths(dir_path))
+            else:
+                target = os.path.join(root, pattern)
+                if os.path.isfile(target):
+                    files.append(target)
         return files
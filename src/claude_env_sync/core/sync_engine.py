@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-import filecmp
+import contextlib
+import errno
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,7 +18,193 @@ from claude_env_sync.models.sync_rules import (
     get_excluded_patterns,
     get_rules_by_tier,
 )
-from claude_env_sync.utils.security import generate_gitignore, scan_for_secrets
+from claude_env_sync.utils.fs import iter_file_paths
+from claude_env_sync.utils.parallel import map_io
+from claude_env_sync.utils.security import (
+    generate_gitignore,
+    scan_for_secrets,
+    scan_for_secrets_first,
+)
+
+# 커널 내부 복사가 지원되지 않을 때(구형 커널, 파일시스템 간 복사 등) 발생하는 errno.
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {
+        errno.ENOSYS,
+        errno.EXDEV,
+        errno.EINVAL,
+        errno.ENOTSUP,
+        errno.EOPNOTSUPP,
+        errno.ENOTSOCK,
+    }
+)
+_KERNEL_COPY_BLOCKSIZE = 1 << 30
+# 사용자 공간 복사 버퍼 크기. 이보다 작은 파일은 한 번에 읽고 쓴다.
+_COPY_BUFSIZE = 1 << 20
+_SMALL_FILE_SIZE = 64 * 1024
+_COMPARE_BUFSIZE = 1 << 20
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+# 두 함수 모두 원본은 명시적 offset으로 읽고, 대상 fd의 위치는 전진시킨다.
+_KERNEL_COPIES = tuple(
+    func
+    for name, func in (
+        ("copy_file_range", _copy_file_range),
+        ("sendfile", _sendfile),
+    )
+    if hasattr(os, name)
+)
+
+
+def _copy_userspace(src_fd: int, dst_fd: int, remaining: int) -> None:
+    """사용자 공간 버퍼를 통해 현재 위치부터 끝까지 복사한다."""
+    with open(src_fd, "rb", buffering=0, closefd=False) as fsrc, open(
+        dst_fd, "wb", closefd=False
+    ) as fdst:
+        if remaining < _SMALL_FILE_SIZE:
+            fdst.write(fsrc.read())
+            return
+
+        buf = bytearray(_COPY_BUFSIZE)
+        with memoryview(buf) as view:
+            while True:
+                n = fsrc.readinto(view)
+                if not n:
+                    break
+                fdst.write(view[:n])
+
+
+def _copy_fd(src_fd: int, dst_fd: int, size: int) -> None:
+    """열린 파일 디스크립터 간에 내용을 복사한다.
+
+    copy_file_range → sendfile 순으로 커널 내부 복사를 시도하고,
+    둘 다 지원되지 않으면 사용자 공간 복사로 이어서 처리한다.
+    일부 파일시스템은 커널 복사에서 에러 없이 0을 반환하므로, 크기만큼
+    복사하기 전에 0이 나오면 끝으로 보지 않고 다음 방법으로 넘어간다.
+    """
+    copied = 0
+    for kernel_copy in _KERNEL_COPIES:
+        try:
+            while True:
+                n = kernel_copy(src_fd, dst_fd, copied, _KERNEL_COPY_BLOCKSIZE)
+                if n == 0:
+                    if copied >= size:
+                        return
+                    break
+                copied += n
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+
+    os.lseek(src_fd, copied, os.SEEK_SET)
+    _copy_userspace(src_fd, dst_fd, size - copied)
+
+
+def _fastcopy(src: str, dst: str) -> None:
+    """파일을 복사하고 mtime과 권한 비트를 보존한다.
+
+    `shutil.copy2`와 달리 xattr/플래그 복사를 생략하고, 원본의 stat을
+    한 번만 조회한다. 같은 디렉토리의 임시 파일에 쓴 뒤 `os.replace`로
+    교체하므로 복사 도중 중단되어도 대상 파일이 잘린 채로 남지 않는다.
+    대상이 심볼릭 링크(dotfiles 저장소 연결 등)면 링크가 아닌 원본을 교체한다.
+    """
+    if os.path.islink(dst):
+        dst = os.path.realpath(dst)
+    head, name = os.path.split(dst)
+    tmp = os.path.join(head, f".{name}.tmp.{os.getpid()}")
+
+    src_fd = os.open(src, os.O_RDONLY | _O_BINARY)
+    try:
+        st = os.fstat(src_fd)
+        dst_fd = os.open(
+            tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666
+        )
+        try:
+            _copy_fd(src_fd, dst_fd, st.st_size)
+        finally:
+            os.close(dst_fd)
+        os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, dst)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+    finally:
+        os.close(src_fd)
+
+
+def _files_equal(a: str, b: str, size: int) -> bool:
+    """크기가 같은 두 파일의 내용을 블록 단위로 비교한다.
+
+    첫 번째 불일치 블록에서 바로 False를 반환한다.
+    """
+    bufsize = max(1, min(size, _COMPARE_BUFSIZE))
+    buf_a = bytearray(bufsize)
+    buf_b = bytearray(bufsize)
+    with open(a, "rb", buffering=0) as fa, open(b, "rb", buffering=0) as fb:
+        while True:
+            na = fa.readinto(buf_a)
+            nb = fb.readinto(buf_b)
+            if na != nb:
+                return False
+            if na < bufsize:
+                # 마지막 블록: 남은 부분만 비교한다.
+                return buf_a[:na] == buf_b[:nb]
+            if buf_a != buf_b:
+                return False
+
+
+def _copy_pairs(pairs: list[tuple[str, str]]) -> None:
+    """(원본, 대상) 경로 쌍을 스레드 풀에서 병렬로 복사한다.
+
+    대상 상위 디렉토리는 복사 전에 미리 만들어 스레드 간 mkdir 경합을 피한다.
+    """
+    srcs = [src for src, _ in pairs]
+    dsts = [dst for _, dst in pairs]
+    _make_parent_dirs(dsts)
+    map_io(_fastcopy, srcs, dsts)
+
+
+def _make_parent_dirs(dsts: list[str]) -> None:
+    """대상 파일들의 상위 디렉토리를 디렉토리당 한 번만 만든다.
+
+    깊은 경로부터 처리해 확인된 디렉토리의 조상은 다시 확인하지 않고,
+    이미 있는 디렉토리는 mkdir(EEXIST)+stat 대신 stat 한 번으로 확인한다.
+    """
+    ensured: set[str] = set()
+    parents = sorted({os.path.dirname(dst) for dst in dsts}, key=len, reverse=True)
+    for parent in parents:
+        if parent in ensured:
+            continue
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
+        while parent not in ensured:
+            ensured.add(parent)
+            parent = os.path.dirname(parent)
+
+
+def _is_changed(src: str, synced: str) -> bool:
+    """동기화 저장소의 사본이 원본과 다른지 확인한다."""
+    try:
+        synced_st = os.stat(synced)
+    except FileNotFoundError:
+        return True
+
+    # push는 mtime을 보존하므로 크기와 mtime이 같으면 내용 비교를 생략한다.
+    src_st = os.stat(src)
+    return src_st.st_size != synced_st.st_size or (
+        src_st.st_mtime_ns != synced_st.st_mtime_ns
+        and not _files_equal(src, synced, src_st.st_size)
+    )
 
 
 @dataclass
@@ -58,6 +248,17 @@ class SyncEngine:
         )
         self._git_ops = GitOps(sync_repo_dir)
         self._excluded = get_excluded_patterns()
+        # 파일마다 패턴 문자열을 가공하지 않도록 매칭용 형태를 미리 만든다.
+        # 디렉토리 패턴은 끝의 "/"를 뗀 접두사로 비교한다 ("debug/"와 "debug"
+        # 둘 다 확인하던 기존 동작과 같다).
+        self._excluded_prefixes = tuple(
+            p.rstrip("/") for p in self._excluded if p.endswith("/")
+        )
+        self._excluded_exact = frozenset(
+            p for p in self._excluded if not p.endswith("/")
+        )
+        self._excluded_suffixes = tuple("/" + p for p in self._excluded_exact)
+        self._sync_patterns = tuple(r.pattern for r in get_rules_by_tier(max_tier))
 
     @property
     def git_ops(self) -> GitOps:
@@ -74,24 +275,48 @@ class SyncEngine:
         if remote_url:
             self._git_ops.add_remote(remote_url)
 
-    def push(self, message: str | None = None) -> SyncResult:
-        """Claude 설정을 동기화 저장소로 push한다."""
+    def push(
+        self, message: str | None = None, report_all_secrets: bool = False
+    ) -> SyncResult:
+        """Claude 설정을 동기화 저장소로 push한다.
+
+        Args:
+            message: 커밋 메시지. None이면 자동 생성한다.
+            report_all_secrets: True면 모든 시크릿을 찾아 보고한다. False면
+                첫 번째 시크릿을 찾는 즉시 스캔을 멈추고 push를 중단한다.
+        """
         result = SyncResult()
 
-        secrets = scan_for_secrets(self._claude_dir)
+        # 시크릿 스캔(파일 내용 읽기)과 동기화 대상 탐색(stat)은 서로 독립적인
+        # I/O이므로 동시에 실행한다.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            files_future = executor.submit(self._list_sync_files)
+            if report_all_secrets:
+                secrets = scan_for_secrets(self._claude_dir)
+            else:
+                first = scan_for_secrets_first(self._claude_dir)
+                secrets = [first] if first is not None else []
+            files = files_future.result()
+
         if secrets:
             result.secrets_found = True
             result.secret_details = [
                 f"{s.file_path.name}:{s.line_number} - {s.pattern_name}"
                 for s in secrets
             ]
-            result.message = f"시크릿 {len(secrets)}건 감지. Push를 중단합니다."
+            if report_all_secrets:
+                result.message = f"시크릿 {len(secrets)}건 감지. Push를 중단합니다."
+            else:
+                result.message = "시크릿 감지. Push를 중단합니다."
             return result
 
-        files_copied = self._copy_to_sync_repo()
+        files_copied = self._copy_to_sync_repo(files)
         result.files_synced = files_copied
+        removed = self._remove_stale_files()
 
-        committed = self._git_ops.add_and_commit(message)
+        committed = self._git_ops.add_and_commit(
+            message, paths=self._staged_pathspecs(removed)
+        )
         result.committed = committed
 
         if committed:
@@ -127,55 +352,103 @@ class SyncEngine:
 
     def _get_sync_patterns(self) -> list[str]:
         """동기화 대상 패턴 목록을 반환한다."""
-        rules = get_rules_by_tier(self._max_tier)
-        return [r.pattern for r in rules]
+        return list(self._sync_patterns)
+
+    def _staged_pathspecs(self, removed: list[str]) -> list[str]:
+        """push 시 스테이징할 pathspec 목록을 반환한다.
+
+        작업 트리 전체 대신 동기화 대상 경로와 .gitignore, 그리고 이번 push에서
+        삭제한 파일만 스테이징한다. git은 작업 트리와 인덱스 어디에도 없는
+        pathspec을 에러로 처리하므로 동기화 대상은 있는 경로만 넘긴다. 삭제한
+        파일은 인덱스에 남아 있으므로 그대로 넘기면 삭제가 스테이징된다.
+        """
+        specs = [".gitignore"]
+        for pattern in self._sync_patterns:
+            spec = pattern.rstrip("/")
+            if (self._sync_repo_dir / spec).exists():
+                specs.append(spec)
+        specs.extend(removed)
+        return specs
+
+    def _remove_stale_files(self) -> list[str]:
+        """Claude 디렉토리에서 삭제된 동기화 대상 파일을 저장소에서도 삭제한다.
+
+        동기화 패턴(파일 패턴과 일치하거나 디렉토리 패턴 하위)에 속하면서
+        Claude 디렉토리에 없는 추적 파일만 대상으로 한다. 패턴 밖의 파일
+        (README 등)과 현재 tier에 없는 파일은 다른 기기의 것일 수 있으므로
+        건드리지 않는다.
+
+        Returns:
+            삭제한 파일의 저장소 기준 상대 경로 목록.
+        """
+        file_patterns = frozenset(
+            p for p in self._sync_patterns if not p.endswith("/")
+        )
+        dir_prefixes = tuple(p for p in self._sync_patterns if p.endswith("/"))
+        claude_root = str(self._claude_dir)
+        stale = [
+            relative
+            for relative in self._git_ops.list_tracked_files()
+            if (relative in file_patterns or relative.startswith(dir_prefixes))
+            and not os.path.lexists(os.path.join(claude_root, relative))
+        ]
+        sync_root = str(self._sync_repo_dir)
+        for relative in stale:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(os.path.join(sync_root, relative))
+        return stale
+
+    def _list_sync_files(self) -> list[str]:
+        """동기화 대상 패턴에 해당하는 Claude 디렉토리의 파일 경로를 반환한다."""
+        return self._path_resolver.list_syncable_paths(self._get_sync_patterns())
 
     def _is_excluded(self, relative_path: str) -> bool:
         """제외 대상인지 확인한다."""
-        for pattern in self._excluded:
-            if pattern.endswith("/"):
-                stripped = pattern.rstrip("/")
-                if relative_path.startswith((pattern, stripped)):
-                    return True
-            elif relative_path == pattern or relative_path.endswith("/" + pattern):
-                return True
-        return False
-
-    def _copy_to_sync_repo(self) -> int:
+        return (
+            relative_path.startswith(self._excluded_prefixes)
+            or relative_path in self._excluded_exact
+            or relative_path.endswith(self._excluded_suffixes)
+        )
+
+    # 파일마다 Path 객체를 만들고 파싱하지 않도록 경로는 문자열로 다룬다.
+    # 목록의 파일은 모두 루트 아래에서 생성된 경로이므로 접두사를 잘라
+    # 상대 경로를 얻는다.
+
+    def _copy_to_sync_repo(self, files: list[str]) -> int:
         """Claude 디렉토리의 파일을 동기화 저장소로 복사한다."""
-        patterns = self._get_sync_patterns()
-        files = self._path_resolver.list_syncable_files(patterns)
-        count = 0
+        prefix_len = len(os.path.join(str(self._claude_dir), ""))
+        sync_root = str(self._sync_repo_dir)
+        pairs: list[tuple[str, str]] = []
 
         for src in files:
-            relative = src.relative_to(self._claude_dir)
-            if self._is_excluded(str(relative)):
+            relative = src[prefix_len:]
+            if self._is_excluded(relative):
                 continue
-            dst = self._sync_repo_dir / relative
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            count += 1
+            pairs.append((src, os.path.join(sync_root, relative)))
 
-        return count
+        _copy_pairs(pairs)
+        return len(pairs)
 
     def _copy_from_sync_repo(self) -> int:
         """동기화 저장소의 파일을 Claude 디렉토리로 복사한다."""
-        count = 0
-        for src in self._sync_repo_dir.rglob("*"):
-            if not src.is_file():
-                continue
-            relative = src.relative_to(self._sync_repo_dir)
-            if str(relative).startswith(".git"):
+        prefix_len = len(os.path.join(str(self._sync_repo_dir), ""))
+        claude_root = str(self._claude_dir)
+        pairs: list[tuple[str, str]] = []
+        # .git 하위(객체 저장소)는 통째로 건너뛴다.
+        files = iter_file_paths(
+            str(self._sync_repo_dir), skip_dir=lambda rel: rel.startswith(".git")
+        )
+        for src in files:
+            relative = src[prefix_len:]
+            if relative.startswith(".git"):
                 continue
-            if relative.name == ".gitignore":
+            if os.path.basename(relative) == ".gitignore":
                 continue
 
-            dst = self._claude_dir / relative
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
-            count += 1
+            pairs.append((src, os.path.join(claude_root, relative)))
 
-        return count
+        _copy_pairs(pairs)
+        return len(pairs)
 
     def _create_backup(self) -> None:
         """현재 Claude 디렉토리를 백업한다."""
@@ -183,29 +456,33 @@ class SyncEngine:
             shutil.rmtree(self._backup_dir)
         self._backup_dir.mkdir(parents=True)
 
-        patterns = self._get_sync_patterns()
-        files = self._path_resolver.list_syncable_files(patterns)
-
-        for src in files:
-            relative = src.relative_to(self._claude_dir)
-            dst = self._backup_dir / relative
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dst)
+        prefix_len = len(os.path.join(str(self._claude_dir), ""))
+        backup_root = str(self._backup_dir)
+        _copy_pairs(
+            [
+                (src, os.path.join(backup_root, src[prefix_len:]))
+                for src in self._list_sync_files()
+            ]
+        )
 
     def _find_changed_files(self) -> list[str]:
         """Claude 디렉토리와 동기화 저장소 간 차이를 찾는다."""
-        changed: list[str] = []
-        patterns = self._get_sync_patterns()
-        files = self._path_resolver.list_syncable_files(patterns)
-
-        for src in files:
-            relative = src.relative_to(self._claude_dir)
-            if self._is_excluded(str(relative)):
+        prefix_len = len(os.path.join(str(self._claude_dir), ""))
+        sync_root = str(self._sync_repo_dir)
+        relatives: list[str] = []
+        srcs: list[str] = []
+
+        for src in self._list_sync_files():
+            relative = src[prefix_len:]
+            if self._is_excluded(relative):
                 continue
-            synced = self._sync_repo_dir / relative
-            if not synced.exists():
-                changed.append(str(relative))
-            elif not filecmp.cmp(src, synced, shallow=False):
-                changed.append(str(relative))
-
-        return changed
+            relatives.append(relative)
+            srcs.append(src)
+
+        synced = [os.path.join(sync_root, relative) for relative in relatives]
+        results = map_io(_is_changed, srcs, synced)
+        return [
+            relative
+            for relative, changed in zip(relatives, results)
+            if changed
+        ]
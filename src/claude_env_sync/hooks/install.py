@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+import re
 from pathlib import Path
 
 HOOK_MARKER = "# >>> claude-sync hook >>>"
@@ -16,66 +19,101 @@ if command -v claude-sync &> /dev/null; then
 fi
 {end_marker}
 """
+_HOOK_SCRIPT = _HOOK_TEMPLATE.format(marker=HOOK_MARKER, end_marker=HOOK_END_MARKER)
+# RC 파일을 디코딩하지 않고 설치 여부를 확인하고 hook을 덧붙일 때 쓴다.
+_HOOK_MARKER_BYTES = HOOK_MARKER.encode()
+_HOOK_SCRIPT_BYTES = _HOOK_SCRIPT.encode()
+
+# hook 블록(마커 줄부터 종료 마커 줄까지)과 그 직전의 빈 줄들을 한 번에 찾는다.
+# 종료 마커가 없으면 파일 끝까지 제거한다.
+_HOOK_BLOCK_PATTERN = re.compile(
+    r"(?:^[^\S\n]*\n)*"
+    r"^[^\n]*" + re.escape(HOOK_MARKER)
+    + r"[\s\S]*?(?:" + re.escape(HOOK_END_MARKER) + r"[^\n]*\n?|\Z)",
+    re.MULTILINE,
+)
 
 
 def generate_hook_script() -> str:
     """Shell hook 스크립트를 생성한다."""
-    return _HOOK_TEMPLATE.format(
-        marker=HOOK_MARKER,
-        end_marker=HOOK_END_MARKER,
-    )
-
-
-def install_shell_hook(rc_file: Path) -> None:
-    """Shell RC 파일에 claude-sync hook을 설치한다.
+    return _HOOK_SCRIPT
 
-    이미 설치되어 있으면 아무것도 하지 않는다 (멱등성).
-    """
-    if is_hook_installed(rc_file):
-        return
 
-    existing = rc_file.read_text() if rc_file.exists() else ""
-    hook_script = generate_hook_script()
+def _hook_append_bytes(existing: bytes) -> bytes:
+    """기존 내용 뒤에 덧붙일 hook 블록(앞의 빈 줄 포함)을 반환한다."""
+    separator = b"\n" if existing and not existing.endswith(b"\n") else b""
+    return separator + b"\n" + _HOOK_SCRIPT_BYTES
 
-    with rc_file.open("w") as f:
-        f.write(existing)
-        if existing and not existing.endswith("\n"):
-            f.write("\n")
-        f.write("\n")
-        f.write(hook_script)
 
+def _strip_hook_blocks(text: str) -> str:
+    """RC 파일 내용에서 hook 블록을 모두 제거한 새 내용을 반환한다."""
+    return _HOOK_BLOCK_PATTERN.sub("", text)
 
-def uninstall_shell_hook(rc_file: Path) -> None:
-    """Shell RC 파일에서 claude-sync hook을 제거한다."""
-    if not rc_file.exists():
-        return
 
-    content = rc_file.read_text()
-    if HOOK_MARKER not in content:
-        return
+def install_shell_hook(rc_file: Path) -> bool:
+    """Shell RC 파일에 claude-sync hook을 설치한다.
 
-    lines = content.splitlines(keepends=True)
-    result: list[str] = []
-    skip = False
+    이미 설치되어 있으면 아무것도 하지 않는다 (멱등성).
 
-    for line in lines:
-        if HOOK_MARKER in line:
-            skip = True
-            # 마커 직전 빈 줄도 제거
-            while result and result[-1].strip() == "":
-                result.pop()
-            continue
-        if HOOK_END_MARKER in line:
-            skip = False
-            continue
-        if not skip:
-            result.append(line)
+    Returns:
+        hook을 새로 설치했으면 True, 이미 설치되어 있었으면 False.
+    """
+    # 읽기와 덧붙이기를 같은 파일 핸들로 해서 확인과 쓰기 사이에
+    # 파일이 바뀌는 경우를 줄인다.
+    with rc_file.open("a+b") as f:
+        f.seek(0)
+        existing = f.read()
+        if _HOOK_MARKER_BYTES in existing:
+            return False
+        # 전체를 다시 쓰지 않고 hook 블록만 덧붙인다.
+        f.write(_hook_append_bytes(existing))
+    return True
+
+
+def uninstall_shell_hook(rc_file: Path) -> bool:
+    """Shell RC 파일에서 claude-sync hook을 제거한다.
+
+    Returns:
+        hook을 제거했으면 True, 설치되어 있지 않았으면 False.
+    """
+    try:
+        existing = rc_file.read_bytes()
+    except FileNotFoundError:
+        return False
+    if _HOOK_MARKER_BYTES not in existing:
+        return False
 
-    rc_file.write_text("".join(result))
+    updated = _strip_hook_blocks(existing.decode("utf-8"))
+    _atomic_write(rc_file, updated.encode("utf-8"))
+    return True
 
 
 def is_hook_installed(rc_file: Path) -> bool:
     """Shell RC 파일에 claude-sync hook이 설치되어 있는지 확인한다."""
-    if not rc_file.exists():
+    try:
+        return _HOOK_MARKER_BYTES in rc_file.read_bytes()
+    except FileNotFoundError:
         return False
-    return HOOK_MARKER in rc_file.read_text()
+
+
+def _atomic_write(rc_file: Path, data: bytes) -> None:
+    """RC 파일 내용을 임시 파일에 쓴 뒤 `os.replace`로 한 번에 교체한다.
+
+    쓰는 도중 중단되어도 RC 파일이 잘린 채로 남지 않는다. 기존 권한을
+    유지하고, RC 파일이 심볼릭 링크(dotfiles 저장소 연결 등)면 링크가 아닌
+    원본을 교체한다.
+    """
+    target = os.path.realpath(rc_file)
+    head, name = os.path.split(target)
+    tmp = os.path.join(head, f".{name}.tmp.{os.getpid()}")
+    mode = os.stat(target).st_mode & 0o7777
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with open(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, mode)
+        os.replace(tmp, target)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from enum import IntEnum
-
-from pydantic import BaseModel
+from functools import cache
 
 
 class SyncTier(IntEnum):
@@ -20,7 +20,8 @@ class SyncTier(IntEnum):
     TIER3 = 3
 
 
-class SyncRule(BaseModel):
+@dataclass(frozen=True)
+class SyncRule:
     """개별 동기화 규칙 정의."""
 
     pattern: str
@@ -31,7 +32,13 @@ class SyncRule(BaseModel):
 
 def get_default_rules() -> list[SyncRule]:
     """기본 동기화 규칙 목록을 반환한다."""
-    return [
+    return list(_default_rules())
+
+
+@cache
+def _default_rules() -> tuple[SyncRule, ...]:
+    """기본 규칙을 한 번만 생성한다."""
+    return (
         SyncRule(
             pattern="CLAUDE.md",
             tier=SyncTier.TIER1,
@@ -80,23 +87,31 @@ def get_default_rules() -> list[SyncRule]:
             is_directory=True,
             description="할일 목록",
         ),
-    ]
+    )
 
 
 def get_rules_by_tier(max_tier: SyncTier = SyncTier.TIER2) -> list[SyncRule]:
     """지정된 Tier 이하의 동기화 규칙만 반환한다."""
-    return [r for r in get_default_rules() if r.tier.value <= max_tier.value]
+    return list(_rules_by_tier(max_tier))
+
+
+@cache
+def _rules_by_tier(max_tier: SyncTier) -> tuple[SyncRule, ...]:
+    return tuple(r for r in _default_rules() if r.tier.value <= max_tier.value)
+
+
+_EXCLUDED_PATTERNS: tuple[str, ...] = (
+    "debug/",
+    "cache/",
+    "paste-cache/",
+    "session-env/",
+    "statusline.log",
+    "stats-cache.json",
+    "statsig/",
+    "settings.local.json",
+)
 
 
 def get_excluded_patterns() -> list[str]:
     """동기화에서 제외할 패턴 목록을 반환한다."""
-    return [
-        "debug/",
-        "cache/",
-        "paste-cache/",
-        "session-env/",
-        "statusline.log",
-        "stats-cache.json",
-        "statsig/",
-        "settings.local.json",
-    ]
+    return list(_EXCLUDED_PATTERNS)
@@ -0,0 +1,48 @@
+"""파일시스템 탐색 유틸리티."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+
+def iter_files(
+    root: Path, skip_dir: Callable[[str], bool] | None = None
+) -> Iterator[Path]:
+    """root 하위의 모든 파일을 재귀적으로 생성한다.
+
+    `rglob("*")` + `is_file()`과 같은 결과를 내지만, DirEntry가 readdir의
+    d_type을 재사용하므로 항목마다 stat을 호출하지 않는다. rglob과 같이
+    심볼릭 링크 디렉토리는 따라가지 않고, 파일 심볼릭 링크는 포함한다.
+
+    Args:
+        root: 탐색할 디렉토리. 존재하지 않으면 아무것도 생성하지 않는다.
+        skip_dir: root 기준 상대 경로를 받아 True를 반환하면 해당 디렉토리
+                  하위를 탐색하지 않는다.
+    """
+    for path in iter_file_paths(str(root), skip_dir):
+        yield Path(path)
+
+
+def iter_file_paths(
+    root: str, skip_dir: Callable[[str], bool] | None = None
+) -> Iterator[str]:
+    """iter_files와 같지만 경로를 문자열로 생성한다.
+
+    경로를 문자열로 다루는 호출자가 파일마다 Path 객체를 만들지 않도록 한다.
+    """
+    prefix_len = len(os.path.join(root, ""))
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if skip_dir is None or not skip_dir(entry.path[prefix_len:]):
+                        stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
@@ -0,0 +1,27 @@
+"""파일 I/O 병렬 실행 유틸리티."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+T = TypeVar("T")
+
+# 파일 I/O는 GIL을 놓으므로 CPU 수보다 넉넉하게 스레드를 둔다.
+MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def map_io(func: Callable[..., T], *iterables: Iterable) -> list[T]:
+    """I/O 위주 함수를 스레드 풀에서 실행하고 입력 순서대로 결과를 반환한다.
+
+    항목이 하나 이하이면 스레드 풀을 만들지 않고 바로 실행한다.
+    작업 중 발생한 예외는 호출한 쪽으로 그대로 전파된다.
+    """
+    args = list(zip(*iterables))
+    if len(args) < 2:
+        return [func(*a) for a in args]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(args))) as executor:
+        return list(executor.map(func, *zip(*args)))
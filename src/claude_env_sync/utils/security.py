@@ -2,22 +2,123 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
+from claude_env_sync.utils.fs import iter_files
+from claude_env_sync.utils.parallel import MAX_IO_WORKERS, map_io
+
+try:
+    import hyperscan
+except ImportError:  # 선택 의존성
+    hyperscan = None
+
+# 토큰은 ASCII로만 이루어지므로 \w가 유니코드 문자까지 매칭하지 않도록
+# re.ASCII로 컴파일한다. 파일 스캔에 쓰는 bytes 패턴과 매칭 범위가 같아진다.
 SECRET_PATTERNS: list[re.Pattern[str]] = [
-    re.compile(r"sk-ant-api\w{2}-[\w-]{20,}"),       # Anthropic API key
-    re.compile(r"sk-proj-[\w-]{20,}"),                # OpenAI project key
-    re.compile(r"sk-[a-zA-Z0-9]{20,}"),               # Generic sk- key
-    re.compile(r"ghp_[a-zA-Z0-9]{36,}"),              # GitHub personal token
-    re.compile(r"gho_[a-zA-Z0-9]{36,}"),              # GitHub OAuth token
-    re.compile(r"github_pat_[a-zA-Z0-9_]{20,}"),      # GitHub fine-grained PAT
-    re.compile(r"xoxb-[\w-]{20,}"),                    # Slack bot token
-    re.compile(r"xoxp-[\w-]{20,}"),                    # Slack user token
-    re.compile(r"AIza[a-zA-Z0-9_-]{35}"),             # Google API key
+    re.compile(r"sk-ant-api\w{2}-[\w-]{20,}", re.ASCII),    # Anthropic API key
+    re.compile(r"sk-proj-[\w-]{20,}", re.ASCII),            # OpenAI project key
+    re.compile(r"sk-[a-zA-Z0-9]{20,}", re.ASCII),           # Generic sk- key
+    re.compile(r"ghp_[a-zA-Z0-9]{36,}", re.ASCII),          # GitHub personal token
+    re.compile(r"gho_[a-zA-Z0-9]{36,}", re.ASCII),          # GitHub OAuth token
+    re.compile(r"github_pat_[a-zA-Z0-9_]{20,}", re.ASCII),  # GitHub fine-grained PAT
+    re.compile(r"xoxb-[\w-]{20,}", re.ASCII),               # Slack bot token
+    re.compile(r"xoxp-[\w-]{20,}", re.ASCII),               # Slack user token
+    re.compile(r"AIza[a-zA-Z0-9_-]{35}", re.ASCII),         # Google API key
 ]
 
+# 각 패턴이 시작하는 리터럴. 대부분의 파일에는 이 중 어느 것도 없으므로
+# 정규식 엔진을 돌리기 전에 부분 문자열 검색으로 먼저 걸러낸다.
+# SECRET_PATTERNS에 패턴을 추가하면 여기에도 접두사를 추가해야 한다.
+_SECRET_PREFIXES: tuple[bytes, ...] = (
+    b"sk-",
+    b"ghp_",
+    b"gho_",
+    b"github_pat_",
+    b"xoxb-",
+    b"xoxp-",
+    b"AIza",
+)
+
+# 모든 패턴을 하나의 alternation으로 합쳐 파일 내용 전체를 한 번만 스캔한다.
+# UTF-8 디코딩을 피하려고 bytes 패턴으로 컴파일하며, 그룹 이름(p0, p1, ...)으로
+# 어떤 패턴이 매칭되었는지 찾는다.
+_COMBINED_PATTERN: re.Pattern[bytes] = re.compile(
+    b"|".join(
+        f"(?P<p{i}>{p.pattern})".encode() for i, p in enumerate(SECRET_PATTERNS)
+    )
+)
+_GROUP_PATTERN_NAMES: dict[str, str] = {
+    f"p{i}": p.pattern for i, p in enumerate(SECRET_PATTERNS)
+}
+
+
+def _build_hyperscan_database():
+    """hyperscan이 설치되어 있으면 SECRET_PATTERNS의 DFA 데이터베이스를 만든다."""
+    if hyperscan is None:
+        return None
+    count = len(SECRET_PATTERNS)
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[p.pattern.encode() for p in SECRET_PATTERNS],
+            ids=list(range(count)),
+            elements=count,
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH] * count,
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+# hyperscan은 매칭 위치 보고 방식이 re와 달라 빠른 사전 필터로만 쓴다.
+# 매칭이 있는 파일만 re로 다시 스캔하므로 탐지 결과는 설치 여부와 무관하다.
+_HS_DATABASE = _build_hyperscan_database()
+# scratch 공간은 동시에 두 스캔이 쓸 수 없으므로 스레드마다 따로 둔다.
+_HS_LOCAL = threading.local()
+
+# git과 같은 방식으로 앞부분에 NUL 바이트가 있으면 바이너리 파일로 보고 건너뛴다.
+_BINARY_SNIFF_SIZE = 8000
+# 내용에 텍스트 시크릿이 있을 수 없는 바이너리/압축 형식은 열지 않는다.
+# (NUL 검사로도 걸러지지만 파일을 열고 읽는 비용까지 아낀다.)
+# 크기로는 거르지 않는다: 큰 history.jsonl도 동기화 대상이므로 나누어 스캔한다.
+_SCAN_SKIP_SUFFIXES = frozenset(
+    {
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".webp",
+        ".ico",
+        ".pdf",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".tgz",
+        ".sqlite",
+        ".db",
+        ".wasm",
+    }
+)
+# 파일은 이 크기 단위로 읽어 스캔하므로 파일 크기와 무관하게 메모리 사용이 일정하다.
+_SCAN_CHUNK_SIZE = 1 << 20
+# 스캔 대상 전체 크기가 이 이상이면 프로세스 풀로 스캔한다. re와 부분 문자열
+# 검색은 GIL을 놓지 않아 스레드로는 CPU 작업이 병렬화되지 않지만, 프로세스
+# 시작 비용이 있으므로 작은 설정 디렉토리는 스레드 풀로 충분하다.
+_PROCESS_SCAN_MIN_BYTES = 64 << 20
+# push는 파일 탐색 스레드가 도는 중에 스캔하므로, 락을 쥔 스레드가 있는 상태로
+# fork하지 않도록 워커는 forkserver(없으면 spawn)로 시작한다.
+_PROCESS_START_METHOD = (
+    "forkserver"
+    if "forkserver" in multiprocessing.get_all_start_methods()
+    else "spawn"
+)
+
 _GITIGNORE_CONTENT = """\
 # Secrets — 절대 동기화하면 안 되는 파일
 **/api_key*
@@ -61,34 +162,166 @@ def generate_gitignore() -> str:
 def scan_for_secrets(directory: Path) -> list[SecretFinding]:
     """디렉토리 내 파일들에서 시크릿 패턴을 탐지한다.
 
+    파일은 병렬로 스캔하고, 결과는 탐색 순서대로 합친다. 대상이 크면
+    CPU를 모두 쓰도록 프로세스 풀을, 그렇지 않으면 스레드 풀을 쓴다.
+
     Args:
         directory: 스캔할 디렉토리 경로.
 
     Returns:
         탐지된 시크릿 목록.
     """
+    files = _scan_targets(directory)
+    if len(files) > 1 and _total_size(files) >= _PROCESS_SCAN_MIN_BYTES:
+        context = multiprocessing.get_context(_PROCESS_START_METHOD)
+        with ProcessPoolExecutor(mp_context=context) as executor:
+            results = list(executor.map(_scan_file, files, chunksize=16))
+    else:
+        results = map_io(_scan_file, files)
+
     findings: list[SecretFinding] = []
+    for file_findings in results:
+        findings.extend(file_findings)
+    return findings
+
+
+def scan_for_secrets_first(directory: Path) -> SecretFinding | None:
+    """디렉토리에서 첫 번째 시크릿을 찾으면 바로 반환한다.
+
+    push 차단 여부만 필요할 때 쓴다. 파일은 병렬로 스캔하되, 탐색 순서상
+    가장 앞선 탐지 결과가 확정되면 아직 시작하지 않은 스캔은 취소한다.
+
+    Returns:
+        탐색 순서상 첫 번째 시크릿. 없으면 None.
+    """
+    files = _scan_targets(directory)
+    if not files:
+        return None
+
+    executor = ThreadPoolExecutor(max_workers=min(MAX_IO_WORKERS, len(files)))
+    try:
+        for file_findings in executor.map(_scan_file, files):
+            if file_findings:
+                return file_findings[0]
+        return None
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
 
-    for file_path in directory.rglob("*"):
-        if not file_path.is_file():
-            continue
+def _scan_targets(directory: Path) -> list[Path]:
+    """시크릿 스캔 대상 파일 목록을 반환한다."""
+    return [
+        path
+        for path in iter_files(directory)
+        if path.suffix.lower() not in _SCAN_SKIP_SUFFIXES
+    ]
 
+
+def _total_size(files: list[Path]) -> int:
+    """파일 크기의 합을 반환한다. 크기를 알 수 없는 파일은 0으로 센다."""
+    total = 0
+    for path in files:
         try:
-            content = file_path.read_text(encoding="utf-8")
-        except (UnicodeDecodeError, PermissionError):
-            continue
-
-        for line_number, line in enumerate(content.splitlines(), start=1):
-            for pattern in SECRET_PATTERNS:
-                match = pattern.search(line)
-                if match:
-                    findings.append(
-                        SecretFinding(
-                            file_path=file_path,
-                            line_number=line_number,
-                            matched_text=match.group(),
-                            pattern_name=pattern.pattern,
+            total += os.path.getsize(path)
+        except OSError:
+            pass
+    return total
+
+
+def _scan_file(file_path: Path) -> list[SecretFinding]:
+    """단일 파일에서 시크릿 패턴을 탐지한다. 읽을 수 없는 파일은 건너뛴다.
+
+    파일을 일정 크기 청크로 읽되, 마지막 개행까지만 스캔하고 나머지는 다음
+    청크 앞에 붙인다. 시크릿 패턴은 개행을 포함하지 않으므로 청크 경계에
+    걸친 매칭도 놓치지 않는다 (개행 없이 아주 긴 줄은 줄 전체를 메모리에 둔다).
+    남은 부분은 청크 목록으로 모아 두고 개행이 나올 때 한 번만 합치므로,
+    긴 줄도 읽을 때마다 다시 복사하지 않는다.
+    mmap은 스캔 중 다른 프로세스가 파일을 줄이면 SIGBUS로 종료될 수 있어
+    쓰지 않는다.
+    """
+    findings: list[SecretFinding] = []
+    try:
+        with open(file_path, "rb") as f:
+            pending: list[bytes] = []
+            line_number = 1
+            first = True
+            while True:
+                chunk = f.read(_SCAN_CHUNK_SIZE)
+                if first:
+                    if b"\x00" in chunk[:_BINARY_SNIFF_SIZE]:
+                        return []
+                    first = False
+                if not chunk:
+                    if pending:
+                        _scan_segment(
+                            file_path, b"".join(pending), line_number, findings
                         )
-                    )
+                    return findings
+                cut = chunk.rfind(b"\n") + 1
+                if not cut:
+                    pending.append(chunk)
+                    continue
+                pending.append(chunk[:cut])
+                line_number = _scan_segment(
+                    file_path, b"".join(pending), line_number, findings
+                )
+                pending = [chunk[cut:]]
+    except PermissionError:
+        return []
 
-    return findings
+
+def _scan_segment(
+    file_path: Path, data: bytes, line_number: int, findings: list[SecretFinding]
+) -> int:
+    """줄 단위로 끝나는 구간에서 시크릿을 찾아 findings에 추가한다.
+
+    Returns:
+        구간 다음 줄의 줄 번호.
+    """
+    if _may_contain_secret(data):
+        counted = 0
+        for match in _COMBINED_PATTERN.finditer(data):
+            # 매칭은 드물므로 줄 번호는 매칭이 있을 때만, 직전 매칭 이후 구간만 센다.
+            start = match.start()
+            line_number += data.count(b"\n", counted, start)
+            counted = start
+            findings.append(
+                SecretFinding(
+                    file_path=file_path,
+                    line_number=line_number,
+                    matched_text=match.group().decode("ascii"),
+                    pattern_name=_GROUP_PATTERN_NAMES[match.lastgroup],
+                )
+            )
+        return line_number + data.count(b"\n", counted)
+    return line_number + data.count(b"\n")
+
+
+def _may_contain_secret(content: bytes) -> bool:
+    """시크릿 패턴이 있을 수 있는지 정규식 스캔 전에 빠르게 확인한다.
+
+    hyperscan이 있으면 DFA로 실제 매칭 여부를 확인하고, 없으면 패턴의
+    리터럴 접두사가 하나라도 있는지만 본다.
+    """
+    if _HS_DATABASE is None:
+        return any(prefix in content for prefix in _SECRET_PREFIXES)
+
+    # 사전 필터는 매칭 유무만 필요하므로 첫 매칭에서 스캔을 중단한다.
+    def on_match(pattern_id, start, end, flags, context):
+        return True
+
+    try:
+        _HS_DATABASE.scan(
+            content, match_event_handler=on_match, scratch=_hs_scratch()
+        )
+    except hyperscan.ScanTerminated:
+        return True
+    return False
+
+
+def _hs_scratch():
+    """현재 스레드의 hyperscan scratch를 반환한다. 처음 쓸 때 만든다."""
+    scratch = getattr(_HS_LOCAL, "scratch", None)
+    if scratch is None:
+        scratch = _HS_LOCAL.scratch = hyperscan.Scratch(_HS_DATABASE)
+    return scratch
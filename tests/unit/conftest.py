@@ -0,0 +1,24 @@
+"""단위 테스트 공용 fixture."""
+
+from __future__ import annotations
+
+import pytest
+from git.cmd import Git
+
+
+@pytest.fixture
+def git_subcommands(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """GitPython이 실행하는 git 하위 명령(`git <cmd> ...`의 cmd)을 기록한다.
+
+    fixture가 활성화된 뒤 실행된 명령만 기록되며, 준비 단계의 명령을 빼려면
+    검사 전에 목록을 비운다.
+    """
+    calls: list[str] = []
+    original = Git.execute
+
+    def recording_execute(self, command, *args, **kwargs):
+        calls.append(command[1])
+        return original(self, command, *args, **kwargs)
+
+    monkeypatch.setattr(Git, "execute", recording_execute)
+    return calls
@@ -0,0 +1,52 @@
+"""fs 모듈 테스트."""
+
+import os
+from pathlib import Path
+
+from claude_env_sync.utils.fs import iter_file_paths, iter_files
+
+
+class TestIterFiles:
+    """iter_files 테스트."""
+
+    def test_matches_rglob(self, tmp_path: Path):
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.md").write_text("x")
+        (tmp_path / "a" / "mid.md").write_text("x")
+        (tmp_path / "a" / "b" / "deep.md").write_text("x")
+        expected = {p for p in tmp_path.rglob("*") if p.is_file()}
+        assert set(iter_files(tmp_path)) == expected
+
+    def test_missing_root_yields_nothing(self, tmp_path: Path):
+        assert list(iter_files(tmp_path / "missing")) == []
+
+    def test_skip_dir_prunes_subtree(self, tmp_path: Path):
+        (tmp_path / ".git" / "objects").mkdir(parents=True)
+        (tmp_path / ".git" / "objects" / "pack").write_text("x")
+        (tmp_path / "agents").mkdir()
+        (tmp_path / "agents" / "a.md").write_text("x")
+        files = list(iter_files(tmp_path, skip_dir=lambda rel: rel == ".git"))
+        assert files == [tmp_path / "agents" / "a.md"]
+
+    def test_follows_file_symlinks_but_not_dir_symlinks(self, tmp_path: Path):
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "secret.md").write_text("x")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "real.md").write_text("x")
+        os.symlink(root / "real.md", root / "link.md")
+        os.symlink(outside, root / "linked_dir")
+        assert {p.name for p in iter_files(root)} == {"real.md", "link.md"}
+
+
+class TestIterFilePaths:
+    """iter_file_paths 테스트."""
+
+    def test_yields_same_files_as_strings(self, tmp_path: Path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "top.md").write_text("x")
+        (tmp_path / "a" / "mid.md").write_text("x")
+        paths = list(iter_file_paths(str(tmp_path)))
+        assert all(isinstance(p, str) for p in paths)
+        assert [Path(p) for p in paths] == list(iter_files(tmp_path))
@@ -2,13 +2,52 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
 
 import pytest
+from git import Repo as GitRepo
 
 from claude_env_sync.core.git_ops import GitOps
 
 
+@pytest.fixture(scope="module", autouse=True)
+def isolated_git_env():
+    """사용자/시스템 git 설정(서명, hook 등)이 테스트에 끼어들지 않게 한다."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("GIT_CONFIG_GLOBAL", os.devnull)
+        mp.setenv("GIT_CONFIG_NOSYSTEM", "1")
+        for role in ("AUTHOR", "COMMITTER"):
+            mp.setenv(f"GIT_{role}_NAME", "claude-sync test")
+            mp.setenv(f"GIT_{role}_EMAIL", "test@example.com")
+        yield
+
+
+@pytest.fixture(scope="session")
+def repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """init_repo()로 만든 `.git` 디렉토리를 세션당 한 번만 만든다.
+
+    테스트 저장소는 버려지므로 커밋마다의 fsync를 끈다.
+    """
+    repo_dir = tmp_path_factory.mktemp("template") / "sync-repo"
+    repo_dir.mkdir()
+    ops = GitOps(repo_dir)
+    ops.init_repo()
+    with ops.repo.config_writer() as config:
+        config.set_value("core", "fsync", "none")
+    ops.close()
+    return repo_dir / ".git"
+
+
+@pytest.fixture(scope="session")
+def bare_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """빈 bare 저장소를 세션당 한 번만 만든다."""
+    bare_dir = tmp_path_factory.mktemp("template") / "bare.git"
+    GitRepo.init(bare_dir, bare=True)
+    return bare_dir
+
+
 @pytest.fixture
 def git_dir(tmp_path: Path) -> Path:
     """임시 Git 저장소 경로를 제공한다."""
@@ -18,13 +57,49 @@ def git_dir(tmp_path: Path) -> Path:
 
 
 @pytest.fixture
-def git_ops(git_dir: Path) -> GitOps:
-    """초기화된 GitOps 인스턴스를 제공한다."""
+def git_ops(git_dir: Path, repo_template: Path) -> GitOps:
+    """초기화된 GitOps 인스턴스를 제공한다.
+
+    테스트마다 `git init`을 실행하지 않고 세션 템플릿을 복사한 뒤 연다.
+    """
+    shutil.copytree(repo_template, git_dir / ".git")
     ops = GitOps(git_dir)
     ops.init_repo()
     return ops
 
 
+@pytest.fixture(scope="session")
+def seeded_bare_template(
+    tmp_path_factory: pytest.TempPathFactory, bare_template: Path
+) -> Path:
+    """main에 커밋(test.txt = "v1") 하나가 있는 bare 저장소를 세션당 한 번만 만든다."""
+    base = tmp_path_factory.mktemp("template")
+    bare = Path(shutil.copytree(bare_template, base / "seeded.git"))
+    GitRepo(bare).git.symbolic_ref("HEAD", "refs/heads/main")
+
+    work = base / "work"
+    work.mkdir()
+    with GitOps(work) as ops:
+        ops.init_repo()
+        (work / "test.txt").write_text("v1")
+        ops.add_and_commit("initial")
+        ops.add_remote(str(bare))
+        ops.push()
+    return bare
+
+
+@pytest.fixture
+def bare_dir(tmp_path: Path, bare_template: Path) -> Path:
+    """원격으로 쓸 빈 bare 저장소 경로를 제공한다."""
+    return Path(shutil.copytree(bare_template, tmp_path / "bare.git"))
+
+
+@pytest.fixture
+def seeded_bare_dir(tmp_path: Path, seeded_bare_template: Path) -> Path:
+    """커밋 하나가 있는 bare 저장소 경로를 제공한다."""
+    return Path(shutil.copytree(seeded_bare_template, tmp_path / "seeded.git"))
+
+
 class TestGitOpsInit:
     """Git 저장소 초기화 테스트."""
 
@@ -51,6 +126,19 @@ class TestGitOpsInit:
         ops = GitOps(git_dir)
         assert ops.is_initialized() is False
 
+    def test_new_repo_starts_on_main(self, git_ops: GitOps, git_dir: Path):
+        """push/pull 기본 브랜치와 맞도록 새 저장소는 main에서 시작한다."""
+        assert (git_dir / ".git" / "HEAD").read_text() == "ref: refs/heads/main\n"
+        (git_dir / "a.txt").write_text("a")
+        git_ops.add_and_commit("first")
+        assert git_ops.repo.active_branch.name == "main"
+
+    def test_existing_repo_branch_is_kept(self, git_dir: Path):
+        GitRepo.init(git_dir).git.symbolic_ref("HEAD", "refs/heads/trunk")
+        ops = GitOps(git_dir)
+        ops.init_repo()
+        assert ops.repo.head.reference.name == "trunk"
+
 
 class TestGitOpsCommit:
     """Git commit 테스트."""
@@ -78,6 +166,16 @@ class TestGitOpsCommit:
         result = git_ops.add_and_commit("empty commit")
         assert result is False
 
+    def test_commit_skips_status_call(
+        self, git_ops: GitOps, git_dir: Path, git_subcommands: list[str]
+    ):
+        """변경 여부를 별도 `git status` 없이 스테이징 결과로 판단한다."""
+        (git_dir / "a.txt").write_text("a")
+        assert git_ops.add_and_commit("first") is True
+        assert git_ops.add_and_commit("again") is False
+        assert git_subcommands.count("add") == 2
+        assert "status" not in git_subcommands
+
     def test_multiple_commits(self, git_ops: GitOps, git_dir: Path):
         """여러 번 커밋할 수 있어야 한다."""
         (git_dir / "a.txt").write_text("a")
@@ -199,6 +297,19 @@ class TestGitOpsDiff:
         (git_dir / "new_file.txt").write_text("new")
         assert git_ops.has_changes() is True
 
+    def test_has_changes_with_many_dirty_files(self, git_ops: GitOps, git_dir: Path):
+        """출력을 끝까지 읽지 않아도 True를 반환해야 한다."""
+        for i in range(2000):
+            (git_dir / f"file{i:04d}.txt").write_text(str(i))
+        assert git_ops.has_changes() is True
+        assert git_ops.has_changes(paths=["file0001.txt"]) is True
+
+    def test_has_changes_raises_on_git_failure(self, git_ops: GitOps):
+        from git.exc import GitCommandError
+
+        with pytest.raises(GitCommandError):
+            git_ops.has_changes(paths=[":(bogus-magic)x"])
+
 
 class TestGitOpsRepoProperty:
     """repo 프로퍼티 접근 테스트."""
@@ -225,6 +336,37 @@ class TestGitOpsRemoteAdvanced:
         """remote가 없으면 None을 반환해야 한다."""
         assert git_ops.get_remote_url() is None
 
+    def test_remote_config_matches_git(self, git_ops: GitOps):
+        """직접 쓴 설정을 git도 같은 원격으로 읽어야 한다."""
+        git_ops.add_remote("https://github.com/test/repo.git")
+        git = git_ops.repo.git
+        assert git.remote("get-url", "origin") == "https://github.com/test/repo.git"
+        assert git.config("--get-all", "remote.origin.fetch") == (
+            "+refs/heads/*:refs/remotes/origin/*"
+        )
+
+    def test_remote_operations_spawn_no_git(
+        self, git_ops: GitOps, git_subcommands: list[str]
+    ):
+        git_ops.add_remote("https://github.com/test/old.git")
+        git_ops.add_remote("https://github.com/test/new.git")
+        assert git_ops.has_remote() is True
+        assert git_subcommands == []
+
+    def test_replacing_remote_drops_tracking_refs(
+        self, tmp_path: Path, seeded_bare_dir: Path, bare_dir: Path
+    ):
+        """교체 시 이전 원격의 추적 브랜치를 지워야 한다."""
+        repo_dir = tmp_path / "clone"
+        GitRepo.clone_from(str(seeded_bare_dir), str(repo_dir))
+        ops = GitOps(repo_dir)
+        ops.init_repo()
+        assert "origin/main" in [r.name for r in ops.repo.remotes.origin.refs]
+
+        ops.add_remote(str(bare_dir))
+        assert ops.repo.git.for_each_ref("refs/remotes/origin/") == ""
+        assert ops.get_remote_url() == str(bare_dir)
+
 
 class TestGitOpsPushPull:
     """push/pull 예외 처리 테스트."""
@@ -247,13 +389,8 @@ class TestGitOpsPushPull:
         with pytest.raises(GitOpsError, match="Pull 실패"):
             git_ops.pull()
 
-    def test_push_success_with_local_remote(self, tmp_path: Path):
+    def test_push_success_with_local_remote(self, tmp_path: Path, bare_dir: Path):
         """로컬 bare repo를 remote로 설정하면 push가 성공해야 한다."""
-        from git import Repo as GitRepo
-
-        bare_dir = tmp_path / "bare.git"
-        GitRepo.init(bare_dir, bare=True)
-
         repo_dir = tmp_path / "work"
         repo_dir.mkdir()
         ops = GitOps(repo_dir)
@@ -268,29 +405,20 @@ class TestGitOpsPushPull:
         result = ops.push()
         assert result is True
 
-    def test_pull_success_with_local_remote(self, tmp_path: Path):
+    def test_pull_success_with_local_remote(
+        self, tmp_path: Path, seeded_bare_dir: Path
+    ):
         """로컬 bare repo에서 pull이 성공해야 한다."""
-        from git import Repo as GitRepo
-
-        bare_dir = tmp_path / "bare.git"
-        GitRepo.init(bare_dir, bare=True)
-
-        # 첫 번째 repo에서 push
+        # 같은 원격을 clone한 두 저장소
         repo1_dir = tmp_path / "repo1"
-        repo1_dir.mkdir()
+        repo2_dir = tmp_path / "repo2"
+        GitRepo.clone_from(str(seeded_bare_dir), str(repo1_dir))
+        GitRepo.clone_from(str(seeded_bare_dir), str(repo2_dir))
         ops1 = GitOps(repo1_dir)
         ops1.init_repo()
-        (repo1_dir / "test.txt").write_text("v1")
-        ops1.add_and_commit("initial")
-        ops1.repo.git.branch("-M", "main")
-        ops1.add_remote(str(bare_dir))
-        ops1.push()
-
-        # 두 번째 repo에서 clone 후 pull
-        repo2_dir = tmp_path / "repo2"
-        GitRepo.clone_from(str(bare_dir), str(repo2_dir))
         ops2 = GitOps(repo2_dir)
         ops2.init_repo()
+        assert (repo2_dir / "test.txt").read_text() == "v1"
 
         # repo1에서 새 커밋 push
         (repo1_dir / "test.txt").write_text("v2")
@@ -321,3 +449,208 @@ class TestGitOpsRestoreWithChanges:
         log = git_ops.get_log()
         assert any("backup" in e.message.lower() for e in log)
         assert (git_dir / "test.txt").read_text() == "v1"
+
+
+class TestGitOpsIterLog:
+    """iter_log 제너레이터 테스트."""
+
+    def test_iter_log_is_lazy(self, git_ops: GitOps, git_dir: Path):
+        (git_dir / "a.txt").write_text("a")
+        git_ops.add_and_commit("first")
+        entries = git_ops.iter_log()
+        assert not isinstance(entries, list)
+        assert [e.message for e in entries] == ["first"]
+
+    def test_root_commit_lists_nested_files(self, git_ops: GitOps, git_dir: Path):
+        (git_dir / "agents").mkdir()
+        (git_dir / "agents" / "coder.md").write_text("agent")
+        (git_dir / "CLAUDE.md").write_text("# cfg")
+        git_ops.add_and_commit("initial")
+        entry = next(git_ops.iter_log(limit=1))
+        assert sorted(entry.files_changed) == ["CLAUDE.md", "agents/coder.md"]
+
+    def test_files_changed_matches_git_diff_tree(
+        self, git_ops: GitOps, git_dir: Path
+    ):
+        (git_dir / "agents").mkdir()
+        (git_dir / "agents" / "coder.md").write_text("agent")
+        (git_dir / "agents" / "keep.md").write_text("keep")
+        (git_dir / "old.txt").write_text("old")
+        git_ops.add_and_commit("initial")
+
+        (git_dir / "agents" / "coder.md").write_text("agent v2")
+        (git_dir / "old.txt").unlink()
+        (git_dir / "rules").mkdir()
+        (git_dir / "rules" / "new.md").write_text("new")
+        git_ops.add_and_commit("update")
+
+        entry = git_ops.get_log(limit=1)[0]
+        expected = git_ops.repo.git.diff_tree(
+            "-r", "--name-only", "--no-commit-id", "HEAD"
+        ).splitlines()
+        assert entry.files_changed == expected
+        assert entry.files_changed == ["agents/coder.md", "old.txt", "rules/new.md"]
+
+    def test_merge_commit_lists_first_parent_changes(
+        self, git_ops: GitOps, git_dir: Path, monkeypatch
+    ):
+        """머지 커밋은 첫 번째 부모 대비 변경 파일을 나열해야 한다."""
+        (git_dir / "base.txt").write_text("base")
+        git_ops.add_and_commit("base")
+        git = git_ops.repo.git
+        git.checkout("-b", "side")
+        (git_dir / "s.txt").write_text("side")
+        git_ops.add_and_commit("side")
+        git.checkout("main")
+        (git_dir / "m.txt").write_text("main")
+        git_ops.add_and_commit("main")
+        git.merge("--no-ff", "side", "-m", "merge")
+
+        entry = git_ops.get_log(limit=1)[0]
+        assert entry.message == "merge"
+        assert entry.files_changed == ["s.txt"]
+
+        # --diff-merges가 없는 git(< 2.31)용 인자로도 같은 결과를 내야 한다.
+        from claude_env_sync.core import git_ops as git_ops_module
+
+        monkeypatch.setattr(
+            git_ops_module, "_first_parent_diff_args", lambda: ("-m", "--first-parent")
+        )
+        assert git_ops.get_log(limit=1)[0].files_changed == ["s.txt"]
+
+    def test_log_parses_records_split_across_reads(
+        self, git_ops: GitOps, git_dir: Path, monkeypatch
+    ):
+        """레코드가 여러 번의 읽기에 걸쳐 나뉘어도 같은 결과를 내야 한다."""
+        from claude_env_sync.core import git_ops as git_ops_module
+
+        (git_dir / "agents").mkdir()
+        for i in range(20):
+            (git_dir / "agents" / f"agent{i:02d}.md").write_text(str(i))
+        git_ops.add_and_commit("first line\n\nbody line")
+        (git_dir / "agents" / "agent00.md").write_text("changed")
+        git_ops.add_and_commit("second")
+        expected = git_ops.get_log()
+
+        monkeypatch.setattr(git_ops_module, "_LOG_READ_SIZE", 7)
+        log = git_ops.get_log()
+        assert log == expected
+        assert [e.message for e in log] == ["second", "first line\n\nbody line"]
+        assert log[0].files_changed == ["agents/agent00.md"]
+        assert len(log[1].files_changed) == 20
+        assert log[0].date.tzinfo is not None
+
+    def test_log_runs_a_single_git_process(
+        self, git_ops: GitOps, git_dir: Path, git_subcommands: list[str]
+    ):
+        """커밋 수와 무관하게 git log 한 번으로 로그를 만든다."""
+        for i in range(3):
+            (git_dir / f"file{i}.txt").write_text(str(i))
+            git_ops.add_and_commit(f"commit {i}")
+
+        # git 버전 확인은 프로세스당 한 번이므로 미리 끝내 둔다.
+        git_ops.get_log()
+        git_subcommands.clear()
+        git_ops.get_log()
+        assert git_subcommands == ["log"]
+
+
+class TestGitOpsStagePaths:
+    """지정 경로 스테이징 테스트."""
+
+    def test_commit_only_given_paths(self, git_ops: GitOps, git_dir: Path):
+        (git_dir / "agents").mkdir()
+        (git_dir / "agents" / "coder.md").write_text("agent")
+        (git_dir / "stray.txt").write_text("stray")
+        assert git_ops.add_and_commit("scoped", paths=["agents"]) is True
+        entry = git_ops.get_log(limit=1)[0]
+        assert entry.files_changed == ["agents/coder.md"]
+        assert git_ops.has_changes() is True
+
+    def test_no_commit_when_given_paths_unchanged(
+        self, git_ops: GitOps, git_dir: Path
+    ):
+        (git_dir / "a.txt").write_text("a")
+        git_ops.add_and_commit("initial")
+        (git_dir / "stray.txt").write_text("stray")
+        assert git_ops.add_and_commit("noop", paths=["a.txt"]) is False
+
+    def test_stage_paths_respects_gitignore(self, git_ops: GitOps, git_dir: Path):
+        (git_dir / ".gitignore").write_text("**/*token*\n")
+        (git_dir / "agents").mkdir()
+        (git_dir / "agents" / "coder.md").write_text("agent")
+        (git_dir / "agents" / "my_token.txt").write_text("secret")
+        git_ops.add_and_commit("scoped", paths=[".gitignore", "agents"])
+        entry = git_ops.get_log(limit=1)[0]
+        assert "agents/my_token.txt" not in entry.files_changed
+
+    def test_deleted_path_is_staged(self, git_ops: GitOps, git_dir: Path):
+        (git_dir / "a.txt").write_text("a")
+        (git_dir / "b.txt").write_text("b")
+        git_ops.add_and_commit("initial")
+        assert sorted(git_ops.list_tracked_files()) == ["a.txt", "b.txt"]
+
+        (git_dir / "b.txt").unlink()
+        assert git_ops.add_and_commit("remove", paths=["b.txt"]) is True
+        assert git_ops.list_tracked_files() == ["a.txt"]
+
+
+class TestGitOpsIsInitialized:
+    """is_initialized 판별 테스트."""
+
+    def test_bare_repo_is_initialized(self, bare_dir: Path):
+        assert GitOps(bare_dir).is_initialized() is True
+
+    def test_stray_head_file_is_not_initialized(self, git_dir: Path):
+        (git_dir / "HEAD").write_text("not a repo")
+        assert GitOps(git_dir).is_initialized() is False
+
+    def test_init_repo_reuses_loaded_repo(self, git_ops: GitOps):
+        repo = git_ops.repo
+        git_ops.init_repo()
+        assert git_ops.repo is repo
+
+    def test_close_releases_repo(self, git_ops: GitOps):
+        from claude_env_sync.core.git_ops import GitOpsError
+
+        with git_ops as ops:
+            assert ops.repo is not None
+        with pytest.raises(GitOpsError):
+            git_ops.repo
+        git_ops.init_repo()
+        assert git_ops.is_initialized() is True
+
+
+class TestGitOpsRestoreCommit:
+    """restore 커밋 내용 테스트."""
+
+    def test_restore_commit_matches_target_tree(self, git_ops: GitOps, git_dir: Path):
+        (git_dir / "test.txt").write_text("v1")
+        git_ops.add_and_commit("v1")
+        sha_v1 = git_ops.get_log(limit=1)[0].sha
+
+        (git_dir / "test.txt").write_text("v2")
+        git_ops.add_and_commit("v2")
+
+        git_ops.restore_to(sha_v1)
+        head = git_ops.repo.head.commit
+        assert head.message.startswith("restore to")
+        assert head.tree.binsha == git_ops.repo.commit(sha_v1).tree.binsha
+        assert git_ops.has_changes() is False
+
+
+class TestGitOpsConcurrency:
+    """스레드 동시 호출 테스트."""
+
+    def test_concurrent_commits_on_one_repo(self, git_ops: GitOps, git_dir: Path):
+        """같은 인스턴스의 커밋은 직렬화되어 index.lock 충돌이 없어야 한다."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def commit(i: int) -> bool:
+            (git_dir / f"file{i}.txt").write_text(str(i))
+            return git_ops.add_and_commit(f"commit {i}", paths=[f"file{i}.txt"])
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(commit, range(8)))
+        assert all(results)
+        assert len(git_ops.get_log(limit=20)) == 8
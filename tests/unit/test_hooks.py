@@ -118,6 +118,15 @@ class TestIsHookInstalled:
         rc_file = tmp_path / ".bashrc"
         assert is_hook_installed(rc_file) is False
 
+    def test_reflects_external_edits(self, tmp_path: Path):
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_text("# nothing here\n")
+        assert is_hook_installed(rc_file) is False
+        rc_file.write_text("# nothing here\n" + generate_hook_script())
+        assert is_hook_installed(rc_file) is True
+        rc_file.unlink()
+        assert is_hook_installed(rc_file) is False
+
 
 class TestInstallHookEdgeCases:
     """Hook 설치 엣지 케이스 테스트."""
@@ -134,8 +143,107 @@ class TestInstallHookEdgeCases:
         assert "export PATH=/usr/bin\n" in content
         assert HOOK_MARKER in content
 
+    def test_install_appends_block_after_blank_line(self, tmp_path: Path):
+        """기존 내용 뒤에 빈 줄 하나를 두고 hook 블록을 덧붙여야 한다."""
+        original = "alias ll='ls -l'\n# 한글 주석"
+        rc_file = tmp_path / ".zshrc"
+        rc_file.write_text(original, encoding="utf-8")
+        install_shell_hook(rc_file)
+        assert rc_file.read_text(encoding="utf-8") == (
+            original + "\n\n" + generate_hook_script()
+        )
+
+    def test_install_keeps_symlinked_rc_file(self, tmp_path: Path):
+        """dotfiles 저장소로 연결된 RC 파일의 링크를 유지해야 한다."""
+        target = tmp_path / "dotfiles" / "zshrc"
+        target.parent.mkdir()
+        target.write_text("export A=1\n")
+        rc_file = tmp_path / ".zshrc"
+        rc_file.symlink_to(target)
+        install_shell_hook(rc_file)
+        assert rc_file.is_symlink()
+        assert HOOK_MARKER in target.read_text()
+
+    def test_uninstall_keeps_symlink_and_mode(self, tmp_path: Path):
+        """제거 시 링크와 권한을 유지하고 임시 파일을 남기지 않아야 한다."""
+        target = tmp_path / "dotfiles" / "zshrc"
+        target.parent.mkdir()
+        target.write_text("export A=1\n")
+        target.chmod(0o600)
+        rc_file = tmp_path / ".zshrc"
+        rc_file.symlink_to(target)
+        install_shell_hook(rc_file)
+
+        assert uninstall_shell_hook(rc_file) is True
+        assert rc_file.is_symlink()
+        assert target.read_text() == "export A=1\n"
+        assert target.stat().st_mode & 0o777 == 0o600
+        assert sorted(p.name for p in target.parent.iterdir()) == ["zshrc"]
+
+    def test_is_installed_with_non_utf8_content(self, tmp_path: Path):
+        """UTF-8이 아닌 내용이 있어도 설치 여부를 판단해야 한다."""
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_bytes(b"# \xff\xfe latin-1\n")
+        assert is_hook_installed(rc_file) is False
+        assert install_shell_hook(rc_file) is True
+        assert is_hook_installed(rc_file) is True
+
     def test_uninstall_missing_file_is_noop(self, tmp_path: Path):
         """존재하지 않는 파일에 uninstall을 호출해도 에러 없어야 한다."""
         rc_file = tmp_path / ".nonexistent"
         uninstall_shell_hook(rc_file)  # 예외 없이 종료
         assert not rc_file.exists()
+
+
+class TestHookRoundTrip:
+    """설치/제거 후 RC 파일 내용 테스트."""
+
+    def test_uninstall_restores_original(self, tmp_path: Path):
+        original = "export PATH=/usr/bin:$PATH\n"
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_text(original)
+        install_shell_hook(rc_file)
+        uninstall_shell_hook(rc_file)
+        assert rc_file.read_text() == original
+
+    def test_install_reports_whether_changed(self, tmp_path: Path):
+        rc_file = tmp_path / ".bashrc"
+        assert install_shell_hook(rc_file) is True
+        assert install_shell_hook(rc_file) is False
+
+    def test_uninstall_reports_whether_changed(self, tmp_path: Path):
+        rc_file = tmp_path / ".bashrc"
+        install_shell_hook(rc_file)
+        assert uninstall_shell_hook(rc_file) is True
+        assert uninstall_shell_hook(rc_file) is False
+
+    def test_uninstall_keeps_content_after_block(self, tmp_path: Path):
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_text(
+            "export A=1\n\n  \n" + generate_hook_script() + "export B=2\n"
+        )
+        uninstall_shell_hook(rc_file)
+        assert rc_file.read_text() == "export A=1\nexport B=2\n"
+
+    def test_uninstall_with_crlf(self, tmp_path: Path):
+        block = generate_hook_script().replace("\n", "\r\n")
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_bytes(
+            ("export A=1\r\n\r\n" + block + "export B=2\r\n").encode()
+        )
+        uninstall_shell_hook(rc_file)
+        assert rc_file.read_bytes() == b"export A=1\r\nexport B=2\r\n"
+
+    def test_uninstall_removes_every_block(self, tmp_path: Path):
+        block = generate_hook_script()
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_text("a\n\n" + block + "b\n\n" + block)
+        uninstall_shell_hook(rc_file)
+        assert rc_file.read_text() == "a\nb\n"
+
+    def test_uninstall_without_end_marker(self, tmp_path: Path):
+        """종료 마커가 없으면 마커부터 끝까지 제거한다."""
+        rc_file = tmp_path / ".bashrc"
+        rc_file.write_text("a\n\n" + HOOK_MARKER + "\nclaude-sync pull\n")
+        uninstall_shell_hook(rc_file)
+        assert rc_file.read_text() == "a\n"
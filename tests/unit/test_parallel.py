@@ -0,0 +1,30 @@
+"""parallel 모듈 테스트."""
+
+import pytest
+
+from claude_env_sync.utils.parallel import map_io
+
+
+class TestMapIo:
+    """map_io 테스트."""
+
+    def test_preserves_input_order(self):
+        assert map_io(lambda x: x * 2, range(50)) == [x * 2 for x in range(50)]
+
+    def test_zips_multiple_iterables(self):
+        assert map_io(lambda a, b: a + b, [1, 2, 3], [10, 20, 30]) == [11, 22, 33]
+
+    def test_empty_input(self):
+        assert map_io(lambda x: x, []) == []
+
+    def test_single_item_runs_inline(self):
+        assert map_io(lambda x: x + 1, [1]) == [2]
+
+    def test_propagates_exception(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("boom")
+            return x
+
+        with pytest.raises(ValueError, match="boom"):
+            map_io(fail, range(10))
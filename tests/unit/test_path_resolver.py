@@ -50,6 +50,19 @@ class TestPathResolver:
         expected = Path.home() / ".claude-sync-backup"
         assert resolver.backup_dir == expected
 
+    def test_explicit_paths_skip_home_lookup(self, monkeypatch):
+        """모든 경로를 지정하면 홈 디렉토리를 조회하지 않아야 한다."""
+        from claude_env_sync.core import path_resolver
+
+        monkeypatch.setattr(path_resolver, "home_dir", None)
+        resolver = PathResolver(
+            claude_dir=Path("/tmp/c"),
+            sync_repo_dir=Path("/tmp/r"),
+            config_file=Path("/tmp/c.toml"),
+            backup_dir=Path("/tmp/b"),
+        )
+        assert resolver.backup_dir == Path("/tmp/b")
+
     def test_claude_dir_exists_returns_true(self, tmp_path):
         """Claude 디렉토리가 존재하면 True를 반환해야 한다."""
         claude_dir = tmp_path / ".claude"
@@ -90,10 +103,10 @@ class TestPathResolver:
         (agents_dir / "test.md").write_text("agent")
 
         resolver = PathResolver(claude_dir=claude_dir)
-        files = resolver.list_syncable_files(["CLAUDE.md", "settings.json", "agents/"])
-        assert claude_dir / "CLAUDE.md" in files
-        assert claude_dir / "settings.json" in files
-        assert claude_dir / "agents" / "test.md" in files
+        files = resolver.list_syncable_paths(["CLAUDE.md", "settings.json", "agents/"])
+        assert str(claude_dir / "CLAUDE.md") in files
+        assert str(claude_dir / "settings.json") in files
+        assert str(claude_dir / "agents" / "test.md") in files
 
     def test_list_existing_files_skips_missing(self, tmp_path):
         """존재하지 않는 파일은 건너뛰어야 한다."""
@@ -102,9 +115,8 @@ class TestPathResolver:
         (claude_dir / "CLAUDE.md").write_text("# Test")
 
         resolver = PathResolver(claude_dir=claude_dir)
-        files = resolver.list_syncable_files(["CLAUDE.md", "nonexistent.json"])
-        assert claude_dir / "CLAUDE.md" in files
-        assert len([f for f in files if f.name == "nonexistent.json"]) == 0
+        files = resolver.list_syncable_paths(["CLAUDE.md", "nonexistent.json"])
+        assert files == [str(claude_dir / "CLAUDE.md")]
 
     def test_list_directory_recursively(self, tmp_path):
         """디렉토리는 재귀적으로 파일을 수집해야 한다."""
@@ -115,6 +127,68 @@ class TestPathResolver:
         (skills_dir / "b.md").write_text("b")
 
         resolver = PathResolver(claude_dir=claude_dir)
-        files = resolver.list_syncable_files(["skills/"])
-        assert claude_dir / "skills" / "a.md" in files
-        assert claude_dir / "skills" / "sub" / "b.md" in files
+        files = resolver.list_syncable_paths(["skills/"])
+        assert str(claude_dir / "skills" / "a.md") in files
+        assert str(claude_dir / "skills" / "sub" / "b.md") in files
+
+    def test_list_directory_picks_up_new_files(self, tmp_path):
+        """디렉토리에 새 파일이 추가되면 다음 호출에 포함해야 한다."""
+        claude_dir = tmp_path / ".claude"
+        agents_dir = claude_dir / "agents"
+        agents_dir.mkdir(parents=True)
+        (agents_dir / "a.md").write_text("a")
+
+        resolver = PathResolver(claude_dir=claude_dir)
+        first = resolver.list_syncable_paths(["agents/"])
+        assert first == [str(agents_dir / "a.md")]
+
+        (agents_dir / "b.md").write_text("b")
+        second = resolver.list_syncable_paths(["agents/"])
+        assert str(agents_dir / "b.md") in second
+        assert len(second) == 2
+
+    def test_list_directory_does_not_follow_dir_symlinks(self, tmp_path):
+        """심볼릭 링크 디렉토리는 따라가지 않아야 한다 (순환 방지)."""
+        claude_dir = tmp_path / ".claude"
+        skills_dir = claude_dir / "skills"
+        skills_dir.mkdir(parents=True)
+        (skills_dir / "a.md").write_text("a")
+        (skills_dir / "loop").symlink_to(skills_dir, target_is_directory=True)
+
+        resolver = PathResolver(claude_dir=claude_dir)
+        files = resolver.list_syncable_paths(["skills/"])
+        assert files == [str(skills_dir / "a.md")]
+
+    def test_nested_patterns_are_listed_once(self, tmp_path):
+        """다른 디렉토리 패턴에 포함된 패턴의 파일은 한 번만 반환해야 한다."""
+        claude_dir = tmp_path / ".claude"
+        (claude_dir / "agents" / "sub").mkdir(parents=True)
+        (claude_dir / "agents" / "a.md").write_text("a")
+        (claude_dir / "agents" / "sub" / "b.md").write_text("b")
+
+        resolver = PathResolver(claude_dir=claude_dir)
+        files = resolver.list_syncable_paths(
+            ["agents/sub/", "agents/", "agents/a.md", "agents/"]
+        )
+        assert sorted(files) == [
+            str(claude_dir / "agents" / "a.md"),
+            str(claude_dir / "agents" / "sub" / "b.md"),
+        ]
+
+    def test_list_syncable_paths_returns_strings(self, tmp_path):
+        """파일 경로를 문자열로 반환해야 한다."""
+        claude_dir = tmp_path / ".claude"
+        (claude_dir / "agents" / "sub").mkdir(parents=True)
+        (claude_dir / "agents" / "a.md").write_text("a")
+        (claude_dir / "agents" / "sub" / "b.md").write_text("b")
+        (claude_dir / "CLAUDE.md").write_text("# cfg")
+
+        resolver = PathResolver(claude_dir=claude_dir)
+        patterns = ["CLAUDE.md", "agents/"]
+        paths = resolver.list_syncable_paths(patterns)
+        assert all(isinstance(p, str) for p in paths)
+        assert sorted(paths) == [
+            str(claude_dir / "CLAUDE.md"),
+            str(claude_dir / "agents" / "a.md"),
+            str(claude_dir / "agents" / "sub" / "b.md"),
+        ]
@@ -1,5 +1,8 @@
 """sync_rules 모듈 테스트."""
 
+import dataclasses
+
+import pytest
 
 from claude_env_sync.models.sync_rules import (
     SyncRule,
@@ -56,6 +59,12 @@ class TestSyncRule:
         )
         assert rule.description == "메인 설정"
 
+    def test_rule_is_immutable(self):
+        """캐시된 기본 규칙이 공유되므로 규칙은 수정할 수 없다."""
+        rule = get_default_rules()[0]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rule.pattern = "other.md"
+
 
 class TestDefaultRules:
     """기본 동기화 규칙 테스트."""
@@ -116,6 +125,13 @@ class TestGetRulesByTier:
         assert "CLAUDE.md" in patterns
         assert "skills/" in patterns
 
+    def test_returned_list_is_a_copy(self):
+        """반환된 리스트를 수정해도 캐시된 규칙에 영향이 없다."""
+        rules = get_rules_by_tier(SyncTier.TIER1)
+        rules.clear()
+        assert get_rules_by_tier(SyncTier.TIER1)
+        assert len(get_default_rules()) == 8
+
 
 class TestExcludedPatterns:
     """제외 패턴 테스트."""
@@ -135,3 +151,7 @@ class TestExcludedPatterns:
     def test_excludes_statusline_log(self):
         excluded = get_excluded_patterns()
         assert "statusline.log" in excluded
+
+    def test_returned_list_is_a_copy(self):
+        get_excluded_patterns().append("CLAUDE.md")
+        assert "CLAUDE.md" not in get_excluded_patterns()